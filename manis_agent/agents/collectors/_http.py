@@ -0,0 +1,28 @@
+"""Shared HTTP session for the news collectors."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Mozilla/5.0 (compatible; MANIS/1.0; +https://github.com/yourusername/manis)'
+
+# One keep-alive session for every collector request. Feeds and article
+# redirects go to the same few hosts, so only the first request per host
+# pays for the TCP + TLS handshake.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+
+# Pool sized for the concurrent feed and redirect threads; transient
+# connection errors are retried with a short backoff. The async feed
+# downloads in _rss_base use the same limits.
+POOL_MAXSIZE = 64
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.2
+
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=POOL_MAXSIZE,
+    max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF)
+)
+SESSION.mount('https://', _ADAPTER)
+SESSION.mount('http://', _ADAPTER)
@@ -0,0 +1,32 @@
+"""Article record produced by the news collectors."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class Article:
+    """
+    One collected news article.
+
+    Collectors build these while filtering feed entries; they are converted
+    with dataclasses.asdict() before being written to session state, which
+    must stay JSON-serializable.
+    """
+
+    # Fixed slots instead of a per-instance __dict__ (declared by hand so
+    # this still works on Python versions without dataclass(slots=True))
+    __slots__ = (
+        'title', 'url', 'source', 'aggregator', 'original_source',
+        'region', 'category', 'timestamp', 'description', 'text'
+    )
+
+    title: str
+    url: str
+    source: str
+    aggregator: str
+    original_source: str
+    region: str
+    category: str
+    timestamp: str
+    description: str
+    text: str
@@ -0,0 +1,338 @@
+"""
+Shared RSS fetching and parsing for the news collectors.
+
+Collectors supply the feed URLs and turn entries into articles; downloading,
+conditional-GET caching and entry parsing live here so every collector gets
+the same behaviour.
+"""
+
+import asyncio
+import html
+import re
+import feedparser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from dateutil import parser as date_parser
+from dateutil.tz import gettz
+from io import BytesIO
+from typing import Dict, List
+from lxml import etree
+from ._http import MAX_RETRIES, POOL_MAXSIZE, RETRY_BACKOFF, SESSION, USER_AGENT
+
+# aiohttp enables fully async batched downloads; without it feeds are fetched in a thread pool
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# feedparser-rs (Rust) parses feeds far faster; without it feedparser and lxml are used
+try:
+    import feedparser_rs
+    FEEDPARSER_RS_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_RS_AVAILABLE = False
+
+# Maximum number of feed downloads in flight at once
+MAX_CONCURRENT_FETCHES = 4
+
+# Per-request timeout for feed downloads, in seconds
+FEED_TIMEOUT = 10
+
+# Re-runs within this window reuse the last poll without touching the network;
+# a minute of staleness is irrelevant against the 48-hour article window
+FEED_REUSE_SECONDS = 60
+
+# Matches any HTML tag; RSS descriptions are short snippets with a handful of tags
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Atom namespace for feeds that use <entry> instead of RSS <item>
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# Timezone abbreviations seen in RSS pubDate values, resolved once at import
+TZINFOS = {
+    'EST': gettz('US/Eastern'), 'EDT': gettz('US/Eastern'),
+    'CST': gettz('US/Central'), 'CDT': gettz('US/Central'),
+    'MST': gettz('US/Mountain'), 'MDT': gettz('US/Mountain'),
+    'PST': gettz('US/Pacific'), 'PDT': gettz('US/Pacific'),
+    'BST': gettz('Europe/London'),
+    'CET': gettz('Europe/Paris'), 'CEST': gettz('Europe/Paris'),
+    'EET': gettz('Europe/Kiev'), 'EEST': gettz('Europe/Kiev'),
+}
+
+
+def strip_html(description: str) -> str:
+    """
+    Convert an HTML snippet to plain text.
+
+    Tags are replaced by spaces, entities are unescaped and whitespace
+    (including non-breaking spaces) is collapsed.
+
+    Args:
+        description: HTML description from the feed
+
+    Returns:
+        Plain text description
+    """
+    # Plain-text descriptions skip the regex and entity passes entirely
+    if '<' not in description and '&' not in description:
+        return ' '.join(description.split())
+    return ' '.join(html.unescape(_TAG_RE.sub(' ', description)).split())
+
+
+def _parse_entry_date(value: str):
+    """Convert an RFC 822 (RSS) or ISO 8601 (Atom) date string to a UTC struct_time."""
+    if not value:
+        return None
+    try:
+        pub_date = date_parser.parse(value, tzinfos=TZINFOS)
+    except (ValueError, OverflowError):
+        return None
+    if pub_date.tzinfo is None:
+        pub_date = pub_date.replace(tzinfo=timezone.utc)
+    return pub_date.astimezone(timezone.utc).timetuple()
+
+
+def parse_feed_entries(raw_xml: bytes, max_entries: int):
+    """
+    Stream-parse RSS <item> / Atom <entry> elements with lxml.
+
+    Only the fields the collector uses (title, link, summary, publication date)
+    are extracted, each element is freed once read, and parsing stops as soon as
+    max_entries entries have been seen so the tail of long feeds is never parsed.
+
+    Args:
+        raw_xml: Raw feed document
+        max_entries: Maximum number of entries to extract
+
+    Returns:
+        feedparser.FeedParserDict with an 'entries' list shaped like feedparser's
+    """
+    entries = []
+    bozo = 0
+
+    try:
+        for _, elem in etree.iterparse(
+            BytesIO(raw_xml),
+            tag=('item', f'{ATOM_NS}entry'),
+            recover=True,
+            resolve_entities=False,
+            no_network=True
+        ):
+            if elem.tag == 'item':
+                link = elem.findtext('link')
+                summary = elem.findtext('description')
+                published = elem.findtext('pubDate')
+                title = elem.findtext('title')
+            else:
+                link_elem = elem.find(f'{ATOM_NS}link')
+                link = link_elem.get('href') if link_elem is not None else None
+                summary = elem.findtext(f'{ATOM_NS}summary') or elem.findtext(f'{ATOM_NS}content')
+                published = elem.findtext(f'{ATOM_NS}published') or elem.findtext(f'{ATOM_NS}updated')
+                title = elem.findtext(f'{ATOM_NS}title')
+
+            entry = feedparser.FeedParserDict(published_parsed=_parse_entry_date(published))
+            if title:
+                entry['title'] = title
+            if link:
+                entry['link'] = link.strip()
+            if summary:
+                entry['summary'] = summary
+            entries.append(entry)
+
+            # Free the element and everything parsed before it to bound memory
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+            if len(entries) >= max_entries:
+                break
+    except etree.XMLSyntaxError:
+        bozo = 1
+
+    return feedparser.FeedParserDict(entries=entries, bozo=bozo)
+
+
+def parse_feed_rs(raw_xml: bytes, max_entries: int = None):
+    """
+    Parse a feed with feedparser-rs.
+
+    HTML sanitizing is skipped because descriptions are stripped to plain
+    text anyway, and parsing stops after max_entries entries.
+
+    Args:
+        raw_xml: Raw feed document
+        max_entries: Maximum number of entries to extract (all if None)
+
+    Returns:
+        feedparser.FeedParserDict with an 'entries' list (mutable, unlike feedparser-rs results)
+    """
+    limits = feedparser_rs.ParserLimits(max_entries=max_entries) if max_entries else None
+    parsed = feedparser_rs.parse_with_limits(raw_xml, limits=limits, sanitize_html=False)
+    return feedparser.FeedParserDict(entries=list(parsed.entries), bozo=int(parsed.bozo))
+
+
+def feed_cache_key(feed_url: str) -> str:
+    """State key for the conditional-GET cache of a feed (app-scoped so it outlives a session)."""
+    return f'app:rss_cache:{feed_url}'
+
+
+def not_modified_feed():
+    """Stand-in feed for an unchanged (or recently fetched) feed, served from the cache."""
+    return feedparser.FeedParserDict(status=304, entries=[])
+
+
+def is_fresh(cached: Dict) -> bool:
+    """Whether a cached feed was fetched within FEED_REUSE_SECONDS."""
+    if not cached or 'ts' not in cached:
+        return False
+    age = datetime.now(timezone.utc) - datetime.fromisoformat(cached['ts'])
+    return age < timedelta(seconds=FEED_REUSE_SECONDS)
+
+
+def _conditional_headers(validators: Dict) -> Dict:
+    """Request headers for a conditional GET from cached 'etag'/'modified' values."""
+    headers = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('modified'):
+        headers['If-Modified-Since'] = validators['modified']
+    return headers
+
+
+def download_feed(feed_url: str, validators: Dict, max_entries: int):
+    """
+    Download a feed over the shared keep-alive session and parse it.
+
+    Uses the same bounded parsers as the async path, so only the first
+    max_entries entries are ever parsed. HTTP errors raise instead of being
+    parsed as an empty feed.
+
+    Args:
+        feed_url: RSS feed URL
+        validators: Cached 'etag'/'modified' values from the previous poll
+        max_entries: Maximum number of entries to parse
+
+    Returns:
+        Parsed feed with 'status', 'etag' and 'modified' set
+    """
+    response = SESSION.get(feed_url, headers=_conditional_headers(validators), timeout=FEED_TIMEOUT)
+    if response.status_code == 304:
+        return not_modified_feed()
+    response.raise_for_status()
+
+    parse = parse_feed_rs if FEEDPARSER_RS_AVAILABLE else parse_feed_entries
+    feed = parse(response.content, max_entries)
+    feed['status'] = response.status_code
+    feed['etag'] = response.headers.get('ETag')
+    feed['modified'] = response.headers.get('Last-Modified')
+    return feed
+
+
+def is_not_modified(feed, cached: Dict) -> bool:
+    """Whether the server answered a conditional GET with 304 and we hold a cached copy."""
+    return bool(cached) and getattr(feed, 'status', None) == 304
+
+
+async def _fetch_feed(
+    session: 'aiohttp.ClientSession',
+    semaphore: asyncio.Semaphore,
+    feed_url: str,
+    validators: Dict,
+    max_entries: int
+):
+    """
+    Download one feed (conditionally, if validators are known) and parse it off the event loop thread.
+
+    Connection and read errors are retried like the shared requests session
+    does, with the same retry count and backoff. HTTP errors raise
+    aiohttp.ClientResponseError without a retry.
+    """
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(feed_url, headers=_conditional_headers(validators)) as response:
+                    if response.status == 304:
+                        return not_modified_feed()
+                    response.raise_for_status()
+                    raw_xml = await response.read()
+                    status = response.status
+                    etag = response.headers.get('ETag')
+                    modified = response.headers.get('Last-Modified')
+                break
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError):
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    # Parsing runs in a worker thread so it overlaps with the remaining downloads
+    parse = parse_feed_rs if FEEDPARSER_RS_AVAILABLE else parse_feed_entries
+    feed = await asyncio.to_thread(parse, raw_xml, max_entries)
+    feed['status'] = status
+    feed['etag'] = etag
+    feed['modified'] = modified
+    return feed
+
+
+def _fetch_all_threaded(feed_urls: List[str], validators: List[Dict], max_entries: List[int]) -> List:
+    """
+    Fetch several RSS feeds in parallel threads (fallback without aiohttp).
+
+    The threads share one keep-alive session and release the GIL while waiting
+    on the socket, so the downloads overlap.
+
+    Args:
+        feed_urls: RSS feed URLs to fetch
+        validators: Cached 'etag'/'modified' values per feed, same order as feed_urls
+        max_entries: Maximum number of entries to parse per feed, same order as feed_urls
+
+    Returns:
+        Parsed feeds in the same order as feed_urls (exceptions are returned in place)
+    """
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        futures = [
+            executor.submit(download_feed, url, cached, limit)
+            for url, cached, limit in zip(feed_urls, validators, max_entries)
+        ]
+
+    feeds = []
+    for future in futures:
+        try:
+            feeds.append(future.result())
+        except Exception as e:
+            feeds.append(e)
+    return feeds
+
+
+async def fetch_all(feed_urls: List[str], validators: List[Dict], max_entries: List[int]) -> List:
+    """
+    Download and parse several RSS feeds concurrently.
+
+    Args:
+        feed_urls: RSS feed URLs to fetch
+        validators: Cached 'etag'/'modified' values per feed, same order as feed_urls
+        max_entries: Maximum number of entries to parse per feed, same order as feed_urls
+
+    Returns:
+        Parsed feeds in the same order as feed_urls (exceptions are returned in place)
+    """
+    if not AIOHTTP_AVAILABLE:
+        return await asyncio.to_thread(_fetch_all_threaded, feed_urls, validators, max_entries)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    timeout = aiohttp.ClientTimeout(total=FEED_TIMEOUT)
+
+    # One keep-alive session for the whole batch, identified and pooled
+    # like the shared requests session used by the sync path
+    async with aiohttp.ClientSession(
+        headers={'User-Agent': USER_AGENT},
+        timeout=timeout,
+        connector=aiohttp.TCPConnector(limit=POOL_MAXSIZE)
+    ) as session:
+        return await asyncio.gather(
+            *[
+                _fetch_feed(session, semaphore, url, cached, limit)
+                for url, cached, limit in zip(feed_urls, validators, max_entries)
+            ],
+            return_exceptions=True
+        )
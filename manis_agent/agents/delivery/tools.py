@@ -1,13 +1,17 @@
 """Email delivery tools using Gmail SMTP or Gmail API."""
 
 import os
+import atexit
 import base64
 import smtplib
+import threading
+import time
+from email import policy
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from typing import Dict
 from google.adk.tools.tool_context import ToolContext
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 
 # Gmail API imports
 try:
@@ -23,6 +27,88 @@ except ImportError:
 # Gmail API scopes
 SCOPES = ['https://www.googleapis.com/auth/gmail.send']
 
+# Digest subject line; the date is appended per day
+SUBJECT_PREFIX = 'MANIS Daily News Digest - '
+
+# Seconds an idle SMTP connection is kept for reuse (Gmail drops idle sessions after a few minutes)
+SMTP_CONN_TTL = 240
+
+# Logged-in SMTP connection shared between sends, guarded by _smtp_lock
+_smtp_lock = threading.Lock()
+_smtp_conn = None
+_smtp_conn_user = None
+_smtp_conn_ts = 0.0
+
+
+def _close_smtp():
+    """Close the pooled SMTP connection, ignoring errors from an already-dead socket."""
+    global _smtp_conn, _smtp_conn_user
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+    _smtp_conn = None
+    _smtp_conn_user = None
+
+
+atexit.register(_close_smtp)
+
+# Gmail API credentials and service, loaded once and reused until the token expires;
+# the service is remembered together with the credentials it was built for
+_gmail_lock = threading.Lock()
+_gmail_creds = None
+_gmail_service = None
+_gmail_service_creds = None
+
+
+def _get_smtp(gmail_address: str, gmail_password: str):
+    """
+    Return a logged-in Gmail SMTP connection, reusing the pooled one while it is alive.
+
+    The caller must hold _smtp_lock.
+
+    Args:
+        gmail_address: Gmail sender address
+        gmail_password: Gmail app password
+
+    Returns:
+        smtplib.SMTP_SSL connection
+    """
+    global _smtp_conn, _smtp_conn_user, _smtp_conn_ts
+
+    if (_smtp_conn is not None and _smtp_conn_user == gmail_address
+            and time.time() - _smtp_conn_ts < SMTP_CONN_TTL):
+        try:
+            if _smtp_conn.noop()[0] == 250:
+                return _smtp_conn
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    _close_smtp()
+    server = smtplib.SMTP_SSL('smtp.gmail.com', 465, timeout=10)
+    try:
+        server.login(gmail_address, gmail_password)
+    except Exception:
+        server.close()
+        raise
+
+    _smtp_conn = server
+    _smtp_conn_user = gmail_address
+    _smtp_conn_ts = time.time()
+    return server
+
+
+@lru_cache(maxsize=2)
+def _subject_for_day(day_ordinal: int) -> str:
+    """Subject line for a given day (proleptic Gregorian ordinal)."""
+    return SUBJECT_PREFIX + date.fromordinal(day_ordinal).strftime('%B %d, %Y')
+
+
+def digest_subject() -> str:
+    """Subject line for today's digest, e.g. 'MANIS Daily News Digest - October 15, 2026'."""
+    return _subject_for_day(date.today().toordinal())
+
 
 def send_email_digest(
     tool_context: ToolContext
@@ -49,8 +135,8 @@ def send_email_digest(
             'error': 'RECIPIENT_EMAIL not set in environment.'
         }
 
-    # Parse multiple recipients (comma-separated)
-    recipients = [email.strip() for email in recipient_email.split(',')]
+    # Parse multiple recipients (comma-separated, ignoring blanks from stray commas)
+    recipients = [email.strip() for email in recipient_email.split(',') if email.strip()]
 
     # Get daily digest from state
     digest_html = tool_context.state.get('daily_digest', '')
@@ -133,21 +219,28 @@ def send_via_smtp(
     Returns:
         Dictionary with send status
     """
-    try:
-        # Create email message
-        message = MIMEMultipart('alternative')
-        message['From'] = gmail_address
-        message['To'] = ', '.join(recipients)
-        message['Subject'] = f"MANIS Daily News Digest - {datetime.now().strftime('%B %d, %Y')}"
+    global _smtp_conn_ts
 
-        # Add HTML body
-        html_part = MIMEText(digest_html, 'html')
-        message.attach(html_part)
+    try:
+        # Create email message (SMTP policy emits CRLF line endings directly)
+        message = build_html_message(
+            recipients=recipients,
+            subject=digest_subject(),
+            html_body=digest_html,
+            sender=gmail_address,
+            message_policy=policy.SMTP
+        )
 
-        # Connect to Gmail SMTP server
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-            server.login(gmail_address, gmail_password)
-            server.send_message(message)
+        # Send over the pooled Gmail SMTP connection; drop it on failure so the next send reconnects
+        with _smtp_lock:
+            server = _get_smtp(gmail_address, gmail_password)
+            try:
+                # One transaction with an envelope RCPT per recipient
+                server.send_message(message, from_addr=gmail_address, to_addrs=recipients)
+            except Exception:
+                _close_smtp()
+                raise
+            _smtp_conn_ts = time.time()
 
         # Store delivery confirmation
         tool_context.state['email_sent'] = True
@@ -200,13 +293,12 @@ def send_via_gmail_api(
                 'error': 'Gmail authentication failed. Run Gmail OAuth setup first, or use SMTP method with app password.'
             }
 
-        # Build Gmail service
-        service = build('gmail', 'v1', credentials=creds)
+        service = get_gmail_service(creds)
 
         # Create email message (Gmail API sends to all recipients in To field)
         message = create_email_message(
             recipients=recipients,
-            subject=f"MANIS Daily News Digest - {datetime.now().strftime('%B %d, %Y')}",
+            subject=digest_subject(),
             html_body=digest_html
         )
 
@@ -243,18 +335,37 @@ def authenticate_gmail():
 
     Looks for token.json for existing credentials.
     If not found, initiates OAuth flow using credentials.json.
+    Credentials are cached for the process and only refreshed once expired.
 
     Returns:
         Credentials object or None if authentication fails
     """
-    creds = None
+    global _gmail_creds
 
+    with _gmail_lock:
+        if _gmail_creds and _gmail_creds.valid:
+            return _gmail_creds
+
+        _gmail_creds = _load_gmail_credentials(_gmail_creds)
+        return _gmail_creds
+
+
+def _load_gmail_credentials(creds):
+    """
+    Refresh cached credentials, or load them from token.json / the OAuth flow.
+
+    Args:
+        creds: Previously cached credentials, or None
+
+    Returns:
+        Credentials object or None if authentication fails
+    """
     # Token file stores user's access and refresh tokens
     token_path = os.path.join(os.path.dirname(__file__), 'token.json')
     credentials_path = os.path.join(os.path.dirname(__file__), 'credentials.json')
 
     # Check if token.json exists
-    if os.path.exists(token_path):
+    if creds is None and os.path.exists(token_path):
         creds = Credentials.from_authorized_user_file(token_path, SCOPES)
 
     # If no valid credentials, let user log in
@@ -279,6 +390,58 @@ def authenticate_gmail():
     return creds
 
 
+def get_gmail_service(creds):
+    """
+    Return the Gmail API service, building it once per set of credentials.
+
+    Args:
+        creds: Credentials from authenticate_gmail()
+
+    Returns:
+        Gmail API service resource
+    """
+    global _gmail_service, _gmail_service_creds
+
+    with _gmail_lock:
+        if _gmail_service is None or creds is not _gmail_service_creds:
+            # The discovery document is bundled with the client library, so skip fetching it
+            _gmail_service = build('gmail', 'v1', credentials=creds, cache_discovery=False)
+            _gmail_service_creds = creds
+        return _gmail_service
+
+
+def build_html_message(
+    recipients: list,
+    subject: str,
+    html_body: str,
+    sender: str = None,
+    message_policy=policy.compat32
+) -> MIMEText:
+    """
+    Build a single-part HTML email.
+
+    The digest has no plain-text version, so a multipart/alternative
+    wrapper would only add a boundary around one part.
+
+    Args:
+        recipients: List of recipient email addresses
+        subject: Email subject line
+        html_body: HTML content for email body
+        sender: Optional From address
+        message_policy: email.policy used when serializing
+
+    Returns:
+        MIMEText message
+    """
+    # No explicit charset: ASCII digests go out as 7bit instead of base64
+    message = MIMEText(html_body, 'html', policy=message_policy)
+    if sender:
+        message['From'] = sender
+    message['To'] = ', '.join(recipients)
+    message['Subject'] = subject
+    return message
+
+
 def create_email_message(recipients: list, subject: str, html_body: str) -> Dict:
     """
     Create a properly formatted email message for Gmail API.
@@ -291,13 +454,7 @@ def create_email_message(recipients: list, subject: str, html_body: str) -> Dict
     Returns:
         Dictionary formatted for Gmail API
     """
-    message = MIMEMultipart('alternative')
-    message['to'] = ', '.join(recipients)
-    message['subject'] = subject
-
-    # Add HTML body
-    html_part = MIMEText(html_body, 'html')
-    message.attach(html_part)
+    message = build_html_message(recipients=recipients, subject=subject, html_body=html_body)
 
     # Encode message
     raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
@@ -355,7 +512,7 @@ def test_email_connection(tool_context: ToolContext) -> Dict:
                 'error': 'Authentication failed'
             }
 
-        service = build('gmail', 'v1', credentials=creds)
+        service = get_gmail_service(creds)
 
         # Test API connection by getting user profile
         profile = service.users().getProfile(userId='me').execute()
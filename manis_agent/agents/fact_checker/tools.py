@@ -1,9 +1,27 @@
 """Fact-checking and source credibility scoring tools."""
 
-from typing import Dict, List
+import re
+from functools import lru_cache
+import numpy as np
+from typing import Dict
 from google.adk.tools.tool_context import ToolContext
 
 
+# Keywords that might indicate claims needing verification
+VERIFICATION_KEYWORDS = [
+    'reportedly', 'allegedly', 'claims', 'unconfirmed',
+    'sources say', 'anonymous', 'rumored', 'speculation'
+]
+# Single case-insensitive pass over each claim instead of one substring
+# search per keyword; longest keywords first so overlapping ones never
+# shadow each other. Substring semantics are kept on purpose, so
+# 'anonymously' still counts as 'anonymous'
+_VERIFICATION_RE = re.compile(
+    '|'.join(re.escape(k) for k in sorted(VERIFICATION_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+
 # Source credibility database (expanded for common sources)
 SOURCE_CREDIBILITY = {
     # High Credibility (80+)
@@ -33,6 +51,42 @@ SOURCE_CREDIBILITY = {
     'Unknown': {'credibility_score': 60, 'political_bias': 'unknown', 'bias_score': 5, 'fact_accuracy': 'unknown', 'notes': 'Source not in credibility database'}
 }
 
+# Punctuation that varies between feeds for the same outlet ("A.P." vs "AP", curly apostrophes)
+_SOURCE_PUNCTUATION = str.maketrans('', '', ".'\u2019")
+
+
+def _source_key(name: str) -> str:
+    """Normalize a source name for lookup: casefolded, punctuation dropped, spaces collapsed."""
+    return ' '.join(name.casefold().translate(_SOURCE_PUNCTUATION).split())
+
+
+# Normalized index over SOURCE_CREDIBILITY, built once at import
+_SOURCE_INDEX = {_source_key(name): data for name, data in SOURCE_CREDIBILITY.items()}
+_UNKNOWN_CREDIBILITY = SOURCE_CREDIBILITY['Unknown']
+
+
+@lru_cache(maxsize=1024)
+def lookup_source_credibility(source: str) -> Dict:
+    """
+    Get the credibility entry for a source name, ignoring case, periods,
+    apostrophes and extra whitespace.
+
+    Args:
+        source: Source name as reported by the collector (may be empty)
+
+    Returns:
+        SOURCE_CREDIBILITY entry, or the 'Unknown' entry if not listed
+    """
+    if not source:
+        return _UNKNOWN_CREDIBILITY
+    return _SOURCE_INDEX.get(_source_key(source), _UNKNOWN_CREDIBILITY)
+
+
+@lru_cache(maxsize=4096)
+def _needs_verification(claim: str) -> bool:
+    """Whether a claim contains a verification keyword (memoized across runs)."""
+    return _VERIFICATION_RE.search(claim) is not None
+
 
 def score_article_credibility(tool_context: ToolContext) -> Dict:
     """
@@ -57,46 +111,34 @@ def score_article_credibility(tool_context: ToolContext) -> Dict:
             'scored_count': 0
         }
 
-    scored_articles = []
-    credibility_stats = {
-        'high_credibility': 0,  # score >= 80
-        'medium_credibility': 0,  # score 60-79
-        'low_credibility': 0,  # score < 60
-        'high_bias': 0,  # bias score >= 7
-        'low_bias': 0,  # bias score < 4
-    }
-
-    for article in articles:
-        # Skip if article is not a dictionary
-        if not isinstance(article, dict):
-            continue
-
-        source = article.get('source', 'Unknown')
-
-        # Get credibility data for source (use Unknown as default)
-        cred_data = SOURCE_CREDIBILITY.get(source, SOURCE_CREDIBILITY['Unknown'])
-
-        # Add credibility metadata to article
-        scored_article = article.copy()
-        scored_article['credibility_score'] = cred_data['credibility_score']
-        scored_article['bias_score'] = cred_data['bias_score']
-        scored_article['fact_accuracy_rating'] = cred_data['fact_accuracy']
-        scored_article['credibility_notes'] = cred_data['notes']
+    # Look up each valid article's source once; stats are computed below
+    # from arrays of the scores rather than per-article branches
+    valid_articles = [a for a in articles if isinstance(a, dict)]
+    # Most of a batch comes from a handful of outlets, so resolve each
+    # distinct source name once and fan the entry out to its articles
+    sources = [a.get('source') for a in valid_articles]
+    cred_by_source = {source: lookup_source_credibility(source) for source in set(sources)}
+    cred_rows = [cred_by_source[source] for source in sources]
 
-        # Update statistics
-        if cred_data['credibility_score'] >= 80:
-            credibility_stats['high_credibility'] += 1
-        elif cred_data['credibility_score'] >= 60:
-            credibility_stats['medium_credibility'] += 1
-        else:
-            credibility_stats['low_credibility'] += 1
+    cred_arr = np.fromiter((c['credibility_score'] for c in cred_rows), dtype=np.int16, count=len(cred_rows))
+    bias_arr = np.fromiter((c['bias_score'] for c in cred_rows), dtype=np.int16, count=len(cred_rows))
 
-        if cred_data['bias_score'] >= 7:
-            credibility_stats['high_bias'] += 1
-        elif cred_data['bias_score'] < 4:
-            credibility_stats['low_bias'] += 1
+    credibility_stats = {
+        'high_credibility': int((cred_arr >= 80).sum()),  # score >= 80
+        'medium_credibility': int(((cred_arr >= 60) & (cred_arr < 80)).sum()),  # score 60-79
+        'low_credibility': int((cred_arr < 60).sum()),  # score < 60
+        'high_bias': int((bias_arr >= 7).sum()),  # bias score >= 7
+        'low_bias': int((bias_arr < 4).sum()),  # bias score < 4
+    }
 
-        scored_articles.append(scored_article)
+    scored_articles = []
+    for article, cred_data in zip(valid_articles, cred_rows):
+        # Add credibility metadata to article in place
+        article['credibility_score'] = cred_data['credibility_score']
+        article['bias_score'] = cred_data['bias_score']
+        article['fact_accuracy_rating'] = cred_data['fact_accuracy']
+        article['credibility_notes'] = cred_data['notes']
+        scored_articles.append(article)
 
     # Check if any articles were successfully scored
     if not scored_articles:
@@ -108,14 +150,15 @@ def score_article_credibility(tool_context: ToolContext) -> Dict:
 
     # Store scored articles in state
     tool_context.state['fact_checked_articles'] = scored_articles
+    tool_context.state['latest_articles_ref'] = 'fact_checked_articles'
     tool_context.state['credibility_stats'] = credibility_stats
 
     return {
         'success': True,
         'scored_count': len(scored_articles),
         'credibility_stats': credibility_stats,
-        'avg_credibility': sum(a['credibility_score'] for a in scored_articles) / len(scored_articles),
-        'avg_bias': sum(a['bias_score'] for a in scored_articles) / len(scored_articles)
+        'avg_credibility': float(cred_arr.mean()),
+        'avg_bias': float(bias_arr.mean())
     }
 
 
@@ -142,12 +185,6 @@ def flag_dubious_claims(tool_context: ToolContext) -> Dict:
             'flagged_count': 0
         }
 
-    # Keywords that might indicate claims needing verification
-    verification_keywords = [
-        'reportedly', 'allegedly', 'claims', 'unconfirmed',
-        'sources say', 'anonymous', 'rumored', 'speculation'
-    ]
-
     flagged_claims = []
     total_claims = 0
 
@@ -159,22 +196,31 @@ def flag_dubious_claims(tool_context: ToolContext) -> Dict:
         claims = article.get('claims', [])
         total_claims += len(claims)
 
-        for claim in claims:
-            claim_lower = claim.lower()
+        # Per-article fields shared by every flagged claim
+        source = article.get('source')
+        title = article.get('title')
+        credibility_score = article.get('credibility_score')
+
+        # Flag every claim from high-bias sources; no need to scan the text
+        if article.get('bias_score', 0) >= 7:
+            flagged_claims.extend({
+                'claim': claim,
+                'source': source,
+                'article_title': title,
+                'reason': 'high_bias_source',
+                'credibility_score': credibility_score
+            } for claim in claims)
+            continue
 
+        for claim in claims:
             # Flag claims with verification keywords
-            needs_verification = any(keyword in claim_lower for keyword in verification_keywords)
-
-            # Flag claims from high-bias sources
-            high_bias = article.get('bias_score', 0) >= 7
-
-            if needs_verification or high_bias:
+            if _needs_verification(claim):
                 flagged_claims.append({
                     'claim': claim,
-                    'source': article.get('source'),
-                    'article_title': article.get('title'),
-                    'reason': 'verification_keyword' if needs_verification else 'high_bias_source',
-                    'credibility_score': article.get('credibility_score')
+                    'source': source,
+                    'article_title': title,
+                    'reason': 'verification_keyword',
+                    'credibility_score': credibility_score
                 })
 
     # Store flagged claims
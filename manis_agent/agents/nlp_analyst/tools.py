@@ -1,10 +1,81 @@
 """NLP analysis tools for sentiment and bias detection."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from google.adk.tools.tool_context import ToolContext
-from textblob import TextBlob
+from textblob.en.sentiments import PatternAnalyzer
 import re
+import numpy as np
 from collections import Counter
+from functools import lru_cache
+
+
+# TextBlob's default sentiment analyzer, called directly so scoring an
+# article does not build a TextBlob (and its lowercased copy) each time
+_SENTIMENT_ANALYZER = PatternAnalyzer()
+
+# Political bias keyword indicators
+LEFT_KEYWORDS = [
+    'progressive', 'reform', 'equality', 'climate', 'healthcare',
+    'workers', 'regulation', 'discrimination', 'rights', 'justice'
+]
+
+RIGHT_KEYWORDS = [
+    'conservative', 'traditional', 'freedom', 'security', 'border',
+    'tax', 'deregulation', 'law and order', 'values', 'patriot'
+]
+
+# Emotional language patterns
+EMOTIONAL_WORDS = [
+    'crisis', 'disaster', 'threat', 'dangerous', 'attack', 'destroy',
+    'scandal', 'corrupt', 'failing', 'radical', 'extreme'
+]
+
+
+# Lowercase word tokens for the bias keyword lookups
+_WORD_RE = re.compile(r'[a-z]+')
+
+
+def _keyword_matcher(keywords: List[str]) -> Tuple[frozenset, Optional[re.Pattern]]:
+    """
+    Split a keyword list into a set of single words and a whole-phrase pattern.
+
+    Single words are matched by set intersection with an article's tokens;
+    multi-word phrases ('law and order') fall back to a word-bounded regex.
+    """
+    words = frozenset(k for k in keywords if ' ' not in k)
+    phrases = [re.escape(k) for k in keywords if ' ' in k]
+    phrase_re = re.compile(r'\b(?:' + '|'.join(phrases) + r')\b') if phrases else None
+    return words, phrase_re
+
+
+def _count_keywords(tokens: set, text_lower: str, matcher: Tuple[frozenset, Optional[re.Pattern]]) -> int:
+    """Count how many distinct keywords of a matcher appear as whole words."""
+    words, phrase_re = matcher
+    count = len(words & tokens)
+    if phrase_re is not None:
+        count += len(set(phrase_re.findall(text_lower)))
+    return count
+
+
+_LEFT_MATCHER = _keyword_matcher(LEFT_KEYWORDS)
+_RIGHT_MATCHER = _keyword_matcher(RIGHT_KEYWORDS)
+_EMOTIONAL_MATCHER = _keyword_matcher(EMOTIONAL_WORDS)
+
+# Simple tokenization for keyword extraction: words with 4+ letters
+_KEYWORD_TOKEN_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Common words to exclude from keywords (stopwords)
+KEYWORD_STOPWORDS = frozenset({
+    'that', 'this', 'with', 'from', 'have', 'been', 'their', 'said',
+    'will', 'were', 'what', 'would', 'there', 'about', 'which', 'when',
+    'they', 'more', 'than', 'other', 'some', 'into', 'could', 'only'
+})
+
+
+@lru_cache(maxsize=512)
+def _source_key(source: str) -> str:
+    """Normalize a source name into a bias_analysis key (e.g. 'the_guardian')."""
+    return source.replace(' ', '_').lower()
 
 
 def analyze_sentiment(tool_context: ToolContext) -> Dict:
@@ -48,10 +119,8 @@ def analyze_sentiment(tool_context: ToolContext) -> Dict:
 
         text = article.get('clean_text', article.get('text', ''))
 
-        # Analyze with TextBlob
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        # Analyze with TextBlob's pattern analyzer
+        polarity, subjectivity = _SENTIMENT_ANALYZER.analyze(text)
 
         # Classify sentiment
         if polarity > 0.1:
@@ -64,16 +133,15 @@ def analyze_sentiment(tool_context: ToolContext) -> Dict:
             sentiment_category = 'neutral'
             sentiment_stats['neutral'] += 1
 
-        # Add sentiment data to article
-        analyzed_article = article.copy()
-        analyzed_article['sentiment_polarity'] = round(polarity, 3)
-        analyzed_article['sentiment_subjectivity'] = round(subjectivity, 3)
-        analyzed_article['sentiment_category'] = sentiment_category
+        # Add sentiment data to article in place
+        article['sentiment_polarity'] = round(polarity, 3)
+        article['sentiment_subjectivity'] = round(subjectivity, 3)
+        article['sentiment_category'] = sentiment_category
 
         total_polarity += polarity
         total_subjectivity += subjectivity
 
-        analyzed_articles.append(analyzed_article)
+        analyzed_articles.append(article)
 
     # Check if any articles were successfully analyzed
     if not analyzed_articles:
@@ -85,6 +153,7 @@ def analyze_sentiment(tool_context: ToolContext) -> Dict:
 
     # Store analyzed articles
     tool_context.state['nlp_analyzed_articles'] = analyzed_articles
+    tool_context.state['latest_articles_ref'] = 'nlp_analyzed_articles'
     tool_context.state['sentiment_stats'] = {
         **sentiment_stats,
         'avg_polarity': round(total_polarity / len(analyzed_articles), 3),
@@ -123,38 +192,30 @@ def detect_political_bias(tool_context: ToolContext) -> Dict:
             'analyzed_count': 0
         }
 
-    # Political bias keyword indicators
-    left_keywords = [
-        'progressive', 'reform', 'equality', 'climate', 'healthcare',
-        'workers', 'regulation', 'discrimination', 'rights', 'justice'
-    ]
-
-    right_keywords = [
-        'conservative', 'traditional', 'freedom', 'security', 'border',
-        'tax', 'deregulation', 'law and order', 'values', 'patriot'
-    ]
-
-    # Emotional language patterns
-    emotional_words = [
-        'crisis', 'disaster', 'threat', 'dangerous', 'attack', 'destroy',
-        'scandal', 'corrupt', 'failing', 'radical', 'extreme'
-    ]
-
-    # Track bias by source (dynamically build as we find sources)
-    bias_analysis = {}
+    # Track bias by source (dynamically build as we find sources): each
+    # source gets an integer id, and per-article signal counts are summed
+    # per id with NumPy after the loop
+    source_ids = {}
+    display_names = []
+    article_source_ids = []
+    article_signals = []
 
     for article in articles:
         # Skip if article is not a dictionary
         if not isinstance(article, dict):
             continue
 
-        text_lower = article.get('clean_text', '').lower()
+        text_lower = article.get('clean_text_lower')
+        if text_lower is None:
+            text_lower = article.get('clean_text', '').lower()
         source = article.get('source', '')
 
-        # Count bias indicators
-        left_count = sum(1 for keyword in left_keywords if keyword in text_lower)
-        right_count = sum(1 for keyword in right_keywords if keyword in text_lower)
-        emotional_count = sum(1 for word in emotional_words if word in text_lower)
+        # Count bias indicators (number of distinct keywords present as
+        # whole words, so 'tax' no longer matches 'taxonomy')
+        tokens = set(_WORD_RE.findall(text_lower))
+        left_count = _count_keywords(tokens, text_lower, _LEFT_MATCHER)
+        right_count = _count_keywords(tokens, text_lower, _RIGHT_MATCHER)
+        emotional_count = _count_keywords(tokens, text_lower, _EMOTIONAL_MATCHER)
 
         # Determine bias direction
         if left_count > right_count:
@@ -170,24 +231,36 @@ def detect_political_bias(tool_context: ToolContext) -> Dict:
         article['right_keyword_count'] = right_count
         article['emotional_language_count'] = emotional_count
 
-        # Aggregate by source (dynamically create entries for each source)
-        source_key = source.replace(' ', '_').lower()
-        if source_key not in bias_analysis:
-            bias_analysis[source_key] = {
-                'left_signals': 0,
-                'right_signals': 0,
-                'emotional_language': 0,
-                'articles': 0,
-                'display_name': source
-            }
-
-        bias_analysis[source_key]['left_signals'] += left_count
-        bias_analysis[source_key]['right_signals'] += right_count
-        bias_analysis[source_key]['emotional_language'] += emotional_count
-        bias_analysis[source_key]['articles'] += 1
+        # Record signals against the source's id (new sources get the next id)
+        source_key = _source_key(source)
+        source_id = source_ids.get(source_key)
+        if source_id is None:
+            source_id = source_ids[source_key] = len(display_names)
+            display_names.append(source)
+
+        article_source_ids.append(source_id)
+        article_signals.append((left_count, right_count, emotional_count))
+
+    # Sum left/right/emotional signals and article counts per source
+    ids = np.asarray(article_source_ids, dtype=np.intp)
+    signal_totals = np.zeros((len(display_names), 3), dtype=np.int64)
+    np.add.at(signal_totals, ids, np.asarray(article_signals, dtype=np.int64).reshape(-1, 3))
+    article_totals = np.bincount(ids, minlength=len(display_names))
+
+    bias_analysis = {}
+    for source_key, source_id in source_ids.items():
+        left_total, right_total, emotional_total = signal_totals[source_id].tolist()
+        bias_analysis[source_key] = {
+            'left_signals': left_total,
+            'right_signals': right_total,
+            'emotional_language': emotional_total,
+            'articles': int(article_totals[source_id]),
+            'display_name': display_names[source_id]
+        }
 
     # Store updated articles and bias analysis
     tool_context.state['bias_analyzed_articles'] = articles
+    tool_context.state['latest_articles_ref'] = 'bias_analyzed_articles'
     tool_context.state['bias_analysis'] = bias_analysis
 
     # Build summary for each source
@@ -228,22 +301,19 @@ def extract_keywords(tool_context: ToolContext) -> Dict:
             'keyword_count': 0
         }
 
-    # Combine all article text
-    all_text = ' '.join(article.get('clean_text', '') for article in articles).lower()
-
-    # Simple tokenization and filtering
-    words = re.findall(r'\b[a-z]{4,}\b', all_text)  # Words with 4+ letters
-
-    # Common words to exclude (stopwords)
-    stopwords = {
-        'that', 'this', 'with', 'from', 'have', 'been', 'their', 'said',
-        'will', 'were', 'what', 'would', 'there', 'about', 'which', 'when',
-        'they', 'more', 'than', 'other', 'some', 'into', 'could', 'only'
-    }
-
-    # Filter and count
-    filtered_words = [word for word in words if word not in stopwords]
-    word_counts = Counter(filtered_words)
+    # Count words article by article instead of joining the whole corpus
+    # into one string first (per-article lowercase text comes from the
+    # preprocessor)
+    word_counts = Counter()
+    for article in articles:
+        if 'clean_text_lower' in article:
+            text_lower = article['clean_text_lower']
+        else:
+            text_lower = article.get('clean_text', '').lower()
+        word_counts.update(
+            word for word in _KEYWORD_TOKEN_RE.findall(text_lower)
+            if word not in KEYWORD_STOPWORDS
+        )
 
     top_keywords = word_counts.most_common(20)
 
@@ -1,13 +1,23 @@
 """Text preprocessing and entity extraction tools."""
 
+import hashlib
+import os
 import re
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
 from google.adk.tools.tool_context import ToolContext
 
+# spaCy pipeline used for NER; set MANIS_SPACY_MODEL=en_core_web_trf for
+# the (more accurate) transformer model, which runs on a GPU when present
+SPACY_MODEL = os.getenv('MANIS_SPACY_MODEL', 'en_core_web_sm')
+
 # Load spaCy model for Named Entity Recognition
 try:
     import spacy
-    nlp = spacy.load("en_core_web_sm")
+    if SPACY_MODEL.endswith('_trf'):
+        spacy.prefer_gpu()
+    # Only doc.ents is used, so load just tok2vec/transformer + ner
+    nlp = spacy.load(SPACY_MODEL, disable=["tagger", "parser", "attribute_ruler", "lemmatizer"])
     SPACY_AVAILABLE = True
 except (ImportError, OSError):
     # spaCy not installed or model not downloaded
@@ -15,6 +25,91 @@ except (ImportError, OSError):
     SPACY_AVAILABLE = False
     print("[PREPROCESSOR] spaCy model not available, using fallback entity extraction")
 
+# Fields preprocess_articles adds to every article
+_PREPROCESSED_FIELDS = (
+    'clean_text', 'clean_text_lower', 'entities', 'persons', 'organizations', 'locations', 'claims', 'word_count'
+)
+
+# Batches at least this large are spread over worker processes by
+# nlp.pipe; smaller ones (a normal digest) stay in-process because worker
+# start-up costs more than it saves
+MULTIPROCESS_MIN_TEXTS = 32
+
+# Entity results for recently seen texts, keyed by a digest of the clean
+# text, so re-running preprocessing on the same articles skips the model
+ENTITY_CACHE_SIZE = 512
+_entity_cache: "OrderedDict[str, Dict[str, List[str]]]" = OrderedDict()
+
+# Patterns used on every article, compiled once at import
+_WS_RE = re.compile(r'\s+')
+# Sequences of 2-3 capitalized words (potential names)
+_NAME_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b')
+# Organizations (words ending in Inc., Corp., LLC, etc.); scanned separately
+# because an organization usually overlaps a name match
+_ORG_RE = re.compile(r'\b([A-Z][A-Za-z\s&]+(?:Inc\.|Corp\.|LLC|Co\.|Ltd\.|Organization|Agency|Department|Committee))')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Keywords indicating claims/assertions
+CLAIM_VERBS = [
+    'said', 'says', 'stated', 'announced', 'reported', 'confirmed',
+    'revealed', 'claimed', 'argued', 'warned', 'predicted', 'declared'
+]
+_CLAIM_VERBS_RE = re.compile(r'\b(?:' + '|'.join(CLAIM_VERBS) + r')\b', re.IGNORECASE)
+
+
+def _fallback_entities(text: str) -> Dict[str, List[str]]:
+    """Uncategorized regex entities (under 'all_entities'), used when spaCy is unavailable."""
+    return {
+        'persons': [],
+        'organizations': [],
+        'locations': [],
+        'all_entities': extract_simple_entities(text)
+    }
+
+
+def _categorize_entities(doc) -> Dict[str, List[str]]:
+    """
+    Split the named entities of a processed spaCy doc by type.
+
+    Args:
+        doc: spaCy Doc
+
+    Returns:
+        Dict with 'persons', 'organizations', and 'locations' keys
+    """
+    # Ordered dicts double as order-preserving sets; stop walking doc.ents
+    # once every bucket holds 15 distinct entities
+    persons = {}
+    organizations = {}
+    locations = {}
+    buckets = {
+        "PERSON": persons,
+        "ORG": organizations,
+        "GPE": locations,  # GPE = Geo-Political Entity
+        "LOC": locations,  # LOC = Location
+    }
+
+    for ent in doc.ents:
+        bucket = buckets.get(ent.label_)
+        if bucket is None or len(bucket) >= 15:
+            continue
+
+        entity_text = ent.text.strip()
+
+        # Skip very short entities (likely errors)
+        if len(entity_text) <= 2:
+            continue
+
+        bucket[entity_text] = None
+        if len(persons) >= 15 and len(organizations) >= 15 and len(locations) >= 15:
+            break
+
+    return {
+        'persons': list(persons),
+        'organizations': list(organizations),
+        'locations': list(locations)
+    }
+
 
 def extract_entities_with_spacy(text: str) -> Dict[str, List[str]]:
     """
@@ -24,53 +119,86 @@ def extract_entities_with_spacy(text: str) -> Dict[str, List[str]]:
         text: Clean article text
 
     Returns:
-        Dict with 'persons', 'organizations', 'locations', and 'all_entities' keys
+        Dict with 'persons', 'organizations', and 'locations' keys; without
+        spaCy the lists are empty and regex matches are under 'all_entities'
     """
     if not SPACY_AVAILABLE or nlp is None:
         # Fallback to old regex-based method
-        simple_entities = extract_simple_entities(text)
-        return {
-            'persons': [],
-            'organizations': [],
-            'locations': [],
-            'all_entities': simple_entities
-        }
+        return _fallback_entities(text)
 
-    # Process text with spaCy
-    doc = nlp(text)
+    return _categorize_entities(nlp(text))
 
-    persons = []
-    organizations = []
-    locations = []
 
-    for ent in doc.ents:
-        entity_text = ent.text.strip()
+def _pipe_settings(n_texts: int) -> Tuple[int, int]:
+    """
+    Pick (n_process, batch_size) for an nlp.pipe call over n_texts.
 
-        # Skip very short entities (likely errors)
-        if len(entity_text) <= 2:
-            continue
+    Stays single-process for small batches and on Windows, where spaCy's
+    multiprocessing is slower than a single process.
+    """
+    if n_texts < MULTIPROCESS_MIN_TEXTS or os.name == 'nt':
+        return 1, 64
+    n_process = max(1, min((os.cpu_count() or 1) - 1, 4))
+    return n_process, max(8, n_texts // n_process)
 
-        if ent.label_ == "PERSON":
-            persons.append(entity_text)
-        elif ent.label_ == "ORG":
-            organizations.append(entity_text)
-        elif ent.label_ in ("GPE", "LOC"):  # GPE = Geo-Political Entity, LOC = Location
-            locations.append(entity_text)
 
-    # Deduplicate while preserving order
-    persons = list(dict.fromkeys(persons))[:15]
-    organizations = list(dict.fromkeys(organizations))[:15]
-    locations = list(dict.fromkeys(locations))[:15]
+def extract_entities_batch(texts: Iterable[str]) -> List[Dict[str, List[str]]]:
+    """
+    Extract categorized entities for many texts in one spaCy pass.
 
-    # Combine all entities for backward compatibility
-    all_entities = persons + organizations + locations
+    nlp.pipe batches the texts through the model, which is much cheaper
+    than calling nlp() once per article. Texts processed recently are
+    served from a small in-process cache instead.
 
-    return {
-        'persons': persons,
-        'organizations': organizations,
-        'locations': locations,
-        'all_entities': all_entities
-    }
+    Args:
+        texts: Clean article texts
+
+    Returns:
+        One entity dict per text, in input order (see extract_entities_with_spacy)
+    """
+    if not SPACY_AVAILABLE or nlp is None:
+        return [_fallback_entities(text) for text in texts]
+
+    texts = list(texts)
+    keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest() for text in texts]
+
+    # Only texts not seen recently go through the model
+    results = {}
+    misses = {}
+    for key, text in zip(keys, texts):
+        cached = _entity_cache.get(key)
+        if cached is not None:
+            _entity_cache.move_to_end(key)
+            results[key] = cached
+        else:
+            misses.setdefault(key, text)
+
+    if misses:
+        n_process, batch_size = _pipe_settings(len(misses))
+        docs = nlp.pipe(misses.values(), batch_size=batch_size, n_process=n_process)
+        for key, doc in zip(misses, docs):
+            results[key] = _entity_cache[key] = _categorize_entities(doc)
+        while len(_entity_cache) > ENTITY_CACHE_SIZE:
+            _entity_cache.popitem(last=False)
+
+    # Fresh lists per article so cached entries are never shared in state
+    return [{field: list(values) for field, values in results[key].items()} for key in keys]
+
+
+def _is_preprocessed(article: Dict) -> bool:
+    """Whether an article already carries every field preprocess_articles adds."""
+    return all(field in article for field in _PREPROCESSED_FIELDS)
+
+
+def _first_n_unique(items: Iterable[str], n: int) -> List[str]:
+    """First n distinct items in order, without consuming the rest."""
+    seen = {}
+    for item in items:
+        if item not in seen:
+            seen[item] = None
+            if len(seen) >= n:
+                break
+    return list(seen)
 
 
 def preprocess_articles(tool_context: ToolContext) -> Dict:
@@ -82,6 +210,11 @@ def preprocess_articles(tool_context: ToolContext) -> Dict:
     - Creates claim list from article text
     - Normalizes text for analysis
 
+    Every article gets the same keys whichever NER path runs: 'clean_text',
+    'clean_text_lower', 'entities' (uncategorized regex matches; empty when
+    spaCy is available), 'persons', 'organizations' and 'locations' (empty
+    without spaCy), 'claims' and 'word_count'. The raw 'text' is removed.
+
     Args:
         tool_context: ADK tool context with collected articles in state
 
@@ -98,40 +231,75 @@ def preprocess_articles(tool_context: ToolContext) -> Dict:
             'processed_count': 0
         }
 
-    processed_articles = []
-    total_entities = 0
-    total_claims = 0
-
-    for article in articles:
-        # Skip if article is not a dictionary
-        if not isinstance(article, dict):
-            continue
+    # Skip entries that are not dictionaries
+    valid_articles = [a for a in articles if isinstance(a, dict)]
 
-        # Clean text
-        text = article.get('text', article.get('description', ''))
+    # The stages annotate articles in place, so on a re-run over the same
+    # collected articles most of them are already preprocessed; only the
+    # rest are cleaned and sent through NER
+    pending = [a for a in valid_articles if not _is_preprocessed(a)]
 
-        # Remove extra whitespace
-        clean_text = re.sub(r'\s+', ' ', text).strip()
-
-        # Extract entities with spaCy NER (categorized by type)
-        entity_data = extract_entities_with_spacy(clean_text)
-        total_entities += len(entity_data['all_entities'])
-
-        # Extract key claims (sentences with strong verbs indicating assertions)
-        claims = extract_claims(clean_text)
-        total_claims += len(claims)
-
-        # Add preprocessing results to article
-        processed_article = article.copy()
-        processed_article['clean_text'] = clean_text
-        processed_article['entities'] = entity_data['all_entities']  # Flat list for backward compat
-        processed_article['persons'] = entity_data['persons']
-        processed_article['organizations'] = entity_data['organizations']
-        processed_article['locations'] = entity_data['locations']
-        processed_article['claims'] = claims
-        processed_article['word_count'] = len(clean_text.split())
+    # Clean text (collapse extra whitespace)
+    clean_texts = [
+        _WS_RE.sub(' ', article.get('text', article.get('description', ''))).strip()
+        for article in pending
+    ]
 
-        processed_articles.append(processed_article)
+    # Extract entities with spaCy NER (categorized by type), batched over
+    # all articles that have any text
+    entity_batches = iter(extract_entities_batch([text for text in clean_texts if text]))
+
+    for article, clean_text in zip(pending, clean_texts):
+        if clean_text:
+            entity_data = next(entity_batches)
+            # Extract key claims (sentences with strong verbs indicating assertions)
+            claims = extract_claims(clean_text)
+        else:
+            entity_data = {'persons': [], 'organizations': [], 'locations': []}
+            claims = []
+
+        persons = entity_data['persons']
+        organizations = entity_data['organizations']
+        locations = entity_data['locations']
+        # Only the regex fallback returns an uncategorized list
+        uncategorized = entity_data.get('all_entities', [])
+
+        # Add preprocessing results to the article in place; each stage only
+        # reads the previous stage's list, so copying the dict (and its full
+        # text) at every stage is unnecessary
+        article['clean_text'] = clean_text
+        # clean_text replaces the raw body; dropping it keeps one less full
+        # copy of every article in session state for the later stages. The
+        # collected dicts belong to this run (the collector's feed cache
+        # keeps its own copies), so nothing else loses the text
+        article.pop('text', None)
+        # Lowercased once here for the keyword scans in later stages
+        article['clean_text_lower'] = clean_text.lower()
+        article['entities'] = uncategorized
+        article['persons'] = persons
+        article['organizations'] = organizations
+        article['locations'] = locations
+        article['claims'] = claims
+        article['word_count'] = len(clean_text.split())
+
+    processed_articles = valid_articles
+
+    # Accumulate statistics in one pass over new and reused articles
+    total_entities = 0
+    total_claims = 0
+    total_words = 0
+    total_persons = 0
+    total_orgs = 0
+    total_locations = 0
+    for article in processed_articles:
+        category_count = len(article['persons']) + len(article['organizations']) + len(article['locations'])
+        total_persons += len(article['persons'])
+        total_orgs += len(article['organizations'])
+        total_locations += len(article['locations'])
+        # One of the two is always empty (see the docstring)
+        total_entities += len(article['entities']) + category_count
+        total_claims += len(article['claims'])
+        total_words += article['word_count']
 
     # Check if any articles were successfully processed
     if not processed_articles:
@@ -143,11 +311,7 @@ def preprocess_articles(tool_context: ToolContext) -> Dict:
 
     # Update state with processed articles
     tool_context.state['preprocessed_articles'] = processed_articles
-
-    # Calculate entity category statistics
-    total_persons = sum(len(a.get('persons', [])) for a in processed_articles)
-    total_orgs = sum(len(a.get('organizations', [])) for a in processed_articles)
-    total_locations = sum(len(a.get('locations', [])) for a in processed_articles)
+    tool_context.state['latest_articles_ref'] = 'preprocessed_articles'
 
     tool_context.state['preprocessing_stats'] = {
         'total_articles': len(processed_articles),
@@ -156,13 +320,13 @@ def preprocess_articles(tool_context: ToolContext) -> Dict:
         'total_organizations': total_orgs,
         'total_locations': total_locations,
         'total_claims': total_claims,
-        'avg_word_count': sum(a['word_count'] for a in processed_articles) / len(processed_articles)
+        'avg_word_count': total_words / len(processed_articles)
     }
 
     # Collect sample entities from first 2 articles for reporting
-    sample_persons = list(set([e for a in processed_articles[:2] for e in a.get('persons', [])]))[:5]
-    sample_orgs = list(set([e for a in processed_articles[:2] for e in a.get('organizations', [])]))[:5]
-    sample_locations = list(set([e for a in processed_articles[:2] for e in a.get('locations', [])]))[:5]
+    sample_persons = _first_n_unique((e for a in processed_articles[:2] for e in a['persons']), 5)
+    sample_orgs = _first_n_unique((e for a in processed_articles[:2] for e in a['organizations']), 5)
+    sample_locations = _first_n_unique((e for a in processed_articles[:2] for e in a['locations']), 5)
 
     return {
         'success': True,
@@ -190,18 +354,9 @@ def extract_simple_entities(text: str) -> List[str]:
     Returns:
         List of entity strings
     """
-    entities = []
-
-    # Pattern for capitalized words (potential names)
-    # Matches sequences of 2-3 capitalized words
-    name_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b'
-    names = re.findall(name_pattern, text)
-    entities.extend(names)
-
-    # Pattern for organizations (words ending in Inc., Corp., LLC, etc.)
-    org_pattern = r'\b([A-Z][A-Za-z\s&]+(?:Inc\.|Corp\.|LLC|Co\.|Ltd\.|Organization|Agency|Department|Committee))'
-    orgs = re.findall(org_pattern, text)
-    entities.extend(orgs)
+    # Capitalized word sequences (potential names), then organization names
+    # with a corporate/agency suffix
+    entities = _NAME_RE.findall(text) + _ORG_RE.findall(text)
 
     # Remove duplicates while preserving order
     seen = set()
@@ -227,16 +382,10 @@ def extract_claims(text: str) -> List[str]:
         List of claim strings
     """
     # Split into sentences (simple approach)
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENT_SPLIT_RE.split(text)
 
     claims = []
 
-    # Keywords indicating claims/assertions
-    claim_verbs = [
-        'said', 'says', 'stated', 'announced', 'reported', 'confirmed',
-        'revealed', 'claimed', 'argued', 'warned', 'predicted', 'declared'
-    ]
-
     for sentence in sentences:
         sentence = sentence.strip()
 
@@ -245,8 +394,7 @@ def extract_claims(text: str) -> List[str]:
             continue
 
         # Check if sentence contains claim verbs
-        sentence_lower = sentence.lower()
-        if any(verb in sentence_lower for verb in claim_verbs):
+        if _CLAIM_VERBS_RE.search(sentence):
             claims.append(sentence)
 
         # Limit to top 5 claims per article
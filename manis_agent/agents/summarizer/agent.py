@@ -1,7 +1,7 @@
 """Summarizer agent for generating daily news digests."""
 
 from google.adk.agents import Agent
-from .tools import get_analysis_results
+from .tools import get_analysis_results, render_digest
 
 
 # Summarizer agent
@@ -10,153 +10,46 @@ summarizer_agent = Agent(
     model="openrouter/google/gemini-2.5-flash-lite-preview-09-2025",
     description="Generates comprehensive daily news digest from analyzed articles",
     instruction="""
-    You are a news digest summarizer that creates structured, insightful summaries.
+    You are a news digest summarizer that writes structured, insightful summaries.
 
     IMMEDIATELY do the following (do NOT just plan - EXECUTE):
 
     Step 1: Call get_analysis_results tool to retrieve all analyzed articles and statistics
-    Step 2: Generate the HTML digest using the data from the tool
+    Step 2: Write the digest prose from that data
+    Step 3: Call render_digest with the prose; it builds the HTML email from a template
 
-    You MUST call the get_analysis_results tool first. Do not skip this step.
+    You MUST call get_analysis_results first and render_digest last. Do not skip either step.
 
-    The tool returns:
+    The get_analysis_results tool returns:
     - current_date - Today's date in YYYY-MM-DD format
-    - articles - All articles with full analysis (sentiment, bias, credibility, category, sentiment_label, bias_label)
+    - articles - All articles with full analysis (sentiment, bias, credibility, category, entities)
     - sentiment_stats - Sentiment distribution statistics
     - bias_analysis - Political bias comparison
     - top_keywords - Most frequent keywords
     - credibility_stats - Source credibility statistics
     - flagged_claims - Claims needing verification
 
-    CRITICAL RULES:
-    1. Use ONLY the actual data from the tool response
-    2. NEVER output placeholder text like "[Article Title]", "[Source Name]", "[Description]", etc.
-    3. Use the REAL article titles, sources, summaries, sentiment scores, credibility scores from the data
-    4. Use the REAL current_date value for the digest date
-    5. If any data is missing, skip that field or say "Not available" - but NEVER use brackets or placeholder text
-
-    Create a comprehensive HTML-formatted daily digest with the following structure:
-
-    ## HTML Structure
-
-    Start with:
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #f0f0f0; background-color: #1e1e1e; padding: 20px; max-width: 900px; margin: 0 auto;">
-
-    IMPORTANT: Use inline styles on EVERY element for email compatibility.
-
-    Then create these sections using REAL data from the tool response:
-
-    ## 1. Title
-    Use the actual current_date value with inline dark theme style:
-    <h1 style="color: #4a9eff; border-bottom: 2px solid #4a9eff; padding-bottom: 10px; font-size: 24px; margin: 20px 0;">Daily News Intelligence Report - 2026-01-26</h1>
-
-    ## 2. EXECUTIVE SUMMARY
-    <h2 style="color: #ffffff; font-size: 18px; margin-top: 30px; font-weight: bold;">1. EXECUTIVE SUMMARY</h2>
-    <p style="color: #d0d0d0; font-size: 14px; line-height: 1.6;">Write 2-3 sentences describing the actual news landscape based on the real articles.</p>
-    <ul style="color: #d0d0d0; font-size: 14px; margin-left: 20px;">
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Total articles analyzed:</strong> Use the actual total_articles count</li>
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Time Period:</strong> Use the actual current_date value</li>
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Key Themes:</strong> List the actual themes from the real articles</li>
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Coverage Areas:</strong> US Politics, Technology, European/Ukraine News</li>
-    </ul>
-
-    ## 3. ARTICLES BY TOPIC
-    <h2 style="color: #ffffff; font-size: 18px; margin-top: 30px; font-weight: bold;">2. ARTICLES BY TOPIC</h2>
-
-    Group articles by their actual 'category' field (politics, technology, europe).
-    Use these topic headings with inline styles:
-    <h3 style="color: #cccccc; font-size: 16px; margin-top: 20px; margin-bottom: 10px;">US Politics</h3>
-    <h3 style="color: #cccccc; font-size: 16px; margin-top: 20px; margin-bottom: 10px;">Technology</h3>
-    <h3 style="color: #cccccc; font-size: 16px; margin-top: 20px; margin-bottom: 10px;">Europe & International</h3>
-
-    For EACH real article in the articles array, create a card with inline dark styles:
-    <div style="background-color: #2d2d2d; padding: 15px; margin-bottom: 15px; border-radius: 5px; border: 1px solid #444;">
-        <div style="font-weight: bold; color: #ffffff; margin-bottom: 8px; font-size: 15px;">Actual Article Title from data - Actual Source from data</div>
-        <p style="margin: 5px 0; font-size: 13px; color: #d0d0d0;"><strong>Summary:</strong> Write a real 2-3 sentence summary of the article</p>
-        <p style="margin: 5px 0; font-size: 13px; color: #d0d0d0;"><strong>Sentiment:</strong> Use actual sentiment label (actual polarity score)</p>
-        <p style="margin: 5px 0; font-size: 13px; color: #d0d0d0;"><strong>Credibility:</strong> Use actual credibility_score/100</p>
-        <p style="margin: 5px 0; font-size: 13px; color: #d0d0d0;"><strong>Key entities:</strong> Use actual entities from data</p>
-        <p style="margin: 5px 0; font-size: 13px;"><a href="actual-url-from-data" style="color: #4a9eff; text-decoration: none;">Link to article</a></p>
-    </div>
+    The HTML layout, dates, counts, scores, entities, links and percentages are
+    filled in by render_digest. Write ONLY these plain-text arguments:
+    - executive_summary: 2-3 sentences describing the actual news landscape
+    - key_themes: short comma-separated list of the real themes in today's articles
+    - article_summaries: one 2-3 sentence summary per article, in EXACTLY the same
+      order as the articles array (one entry for EVERY article, none skipped)
+    - credibility_interpretation: brief interpretation of the real credibility data
+    - framing_examples: 2-3 concrete examples of how different sources frame the
+      same stories, comparing their sentiment and bias, e.g.
+      "Ukraine Coverage: BBC (neutral, factual) vs. Al Jazeera (critical tone)"
+    - bottom_line: 2-3 sentences summarizing the key takeaways
+    - perspective_differences: real differences from the bias_analysis data
+    - reading_recommendations: actual articles worth reading, based on importance/credibility
 
-    IMPORTANT: Process EVERY article in the articles array. Do NOT skip articles or use placeholders.
-    DO NOT use white backgrounds for the cards. Keep them dark grey (#2d2d2d).
-
-    ## 4. CREDIBILITY ASSESSMENT
-    <h2 style="color: #ffffff; font-size: 18px; margin-top: 30px; font-weight: bold;">3. CREDIBILITY ASSESSMENT</h2>
-    <ul style="color: #d0d0d0; font-size: 14px; margin-left: 20px;">
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Distribution:</strong> Calculate from actual credibility_stats (count high/medium/low)</li>
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Average credibility score:</strong> Calculate from actual credibility_score values</li>
-        <li style="color: #d0d0d0; font-size: 14px;"><strong>Flagged claims needing verification:</strong> Use actual flagged_claims data or "None"</li>
-    </ul>
-    <p style="color: #d0d0d0; font-size: 14px;">Write a brief interpretation based on the real credibility data.</p>
-
-    ## 5. COVERAGE ANALYSIS & MEDIA FRAMING
-    <h2 style="color: #ffffff; font-size: 18px; margin-top: 30px; font-weight: bold;">4. COVERAGE ANALYSIS & MEDIA FRAMING</h2>
-
-    <p style="color: #d0d0d0; font-size: 14px;"><strong>Sentiment Distribution by Topic:</strong></p>
-    <ul style="color: #d0d0d0; font-size: 14px; margin-left: 20px;">
-        Group articles by their 'category' field (politics, technology, europe) and calculate sentiment breakdown for each topic.
-        For each topic, count articles with sentiment_label 'positive', 'negative', 'neutral' and show as percentages.
-        Example: <li style="color: #d0d0d0; font-size: 14px;">US Politics: 60% Negative, 30% Neutral, 10% Positive</li>
-    </ul>
-
-    <p style="color: #d0d0d0; font-size: 14px;"><strong>Source Perspective Differences:</strong></p>
-    <p style="color: #d0d0d0; font-size: 14px; margin-left: 20px;">
-        Analyze how different sources frame the same stories. Look at articles covering similar topics but from different sources.
-        Compare their sentiment_label and bias_label to identify framing differences.
-        Example: "Ukraine Coverage: BBC (neutral, factual) vs. Al Jazeera (critical tone) vs. Reuters (cautiously optimistic)"
-        Write 2-3 concrete examples based on the actual articles.
-    </p>
-
-    <p style="color: #d0d0d0; font-size: 14px;"><strong>Most Covered Topics (by article count):</strong></p>
-    <ul style="color: #d0d0d0; font-size: 14px; margin-left: 20px;">
-        CRITICAL: Use ONLY the 'category' field from each article. Count each article EXACTLY ONCE.
-        Group articles by their actual 'category' value (politics, technology, europe, etc.).
-        Count how many articles are in each category and list them.
-        The total count across all categories MUST equal the total_articles number.
-        Example: <li style="color: #d0d0d0; font-size: 14px;">US Politics (5 articles)</li>
-        Example: <li style="color: #d0d0d0; font-size: 14px;">Technology (3 articles)</li>
-        Example: <li style="color: #d0d0d0; font-size: 14px;">Europe & International (3 articles)</li>
-        VERIFY: Your counts must add up to the total article count. DO NOT double-count articles.
-    </ul>
-
-    ## 6. BOTTOM LINE
-    <h2 style="color: #ffffff; font-size: 18px; margin-top: 30px; font-weight: bold;">5. BOTTOM LINE</h2>
-    <p style="color: #d0d0d0; font-size: 14px;">Write 2-3 sentences summarizing the real key takeaways from today's actual articles.</p>
-    <p style="color: #d0d0d0; font-size: 14px;"><strong>Notable perspective differences between sources:</strong> Describe real differences from the bias_analysis data</p>
-    <p style="color: #d0d0d0; font-size: 14px;"><strong>Recommendations for further reading:</strong> Recommend actual articles based on their importance/credibility</p>
-
-    </body>
-    </html>
-
-    ---
-
-    CRITICAL REMINDERS:
-    - Use REAL data from the tool response for EVERYTHING
-    - NEVER output text in brackets like [this] or placeholders like "Article Title Placeholder"
-    - Process ALL articles in the articles array - don't skip any
-    - Use actual values for dates, scores, sources, titles, URLs
-    - If a field is missing, write "Not available" instead of placeholder text
-    - Be specific and concrete - write about the actual articles you received
-
-    OUTPUT FORMATTING:
-    - Return ONLY the raw HTML code.
-    - START your response immediately with "<!DOCTYPE html>".
-    - END your response immediately with "</html>".
-    - DO NOT write "Here is the digest" or any other conversational text.
-    - DO NOT use markdown code fences (no ```html).
-    - DO NOT include the "Data Summary from Tool Response" or any debug info.
-    - DO NOT include markdown headers like '###' or '**' at the start of the response.
+    CRITICAL RULES:
+    - Use ONLY the actual data from the tool response
+    - NEVER output placeholder text or text in brackets like [Article Title]
+    - Write plain text only: no HTML tags, no markdown
+    - If something is not available, say "Not available"
 
-    Return the complete HTML digest with REAL data only.
+    After render_digest succeeds, reply with one short sentence confirming the digest was rendered.
     """,
-    tools=[get_analysis_results],
-    output_key="daily_digest"
+    tools=[get_analysis_results, render_digest]
 )
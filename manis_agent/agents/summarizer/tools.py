@@ -1,8 +1,102 @@
-"""Tools for accessing analysis results for digest generation."""
+"""Tools for accessing analysis results and rendering the daily digest."""
 
-from typing import Dict
+import os
+from collections import Counter
+from typing import Dict, List
 from google.adk.tools.tool_context import ToolContext
 from datetime import datetime
+from jinja2 import Environment, FileSystemLoader
+
+
+# Article lists written by the pipeline stages, most analyzed first
+ARTICLE_STAGE_KEYS = (
+    'bias_analyzed_articles',
+    'nlp_analyzed_articles',
+    'fact_checked_articles',
+    'preprocessed_articles',
+    'collected_articles',
+)
+
+# Article fields the digest uses; everything else (clean_text and its
+# lowercase copy, keyword counters, ...) only inflates the model prompt
+DIGEST_ARTICLE_KEYS = (
+    'title', 'source', 'original_source', 'url', 'category', 'timestamp', 'description',
+    'sentiment_category', 'sentiment_polarity', 'bias_direction',
+    'credibility_score', 'fact_accuracy_rating',
+    'persons', 'organizations', 'locations', 'entities',
+)
+
+# Display headings for the article 'category' field; anything else is title-cased
+TOPIC_HEADINGS = {
+    'politics': 'US Politics',
+    'technology': 'Technology',
+    'europe': 'Europe & International',
+}
+
+MAX_CARD_ENTITIES = 6
+
+# The HTML skeleton (inline styles for email clients) lives in a template so
+# the model only writes the prose; autoescape keeps article text from
+# breaking the markup
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'templates')),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+
+
+def _latest_articles(state) -> List:
+    """
+    Get the article list written by the most recent pipeline stage.
+
+    Every stage records the state key it wrote under 'latest_articles_ref';
+    the stage chain is only walked when that pointer is missing or empty
+    (e.g. state from an older run), and the result is remembered.
+    """
+    ref = state.get('latest_articles_ref')
+    if ref:
+        articles = state.get(ref)
+        if articles:
+            return articles
+
+    for key in ARTICLE_STAGE_KEYS:
+        articles = state.get(key)
+        if articles:
+            state['latest_articles_ref'] = key
+            return articles
+    return []
+
+
+def _is_google_news(article: Dict) -> bool:
+    """Whether an article came through Google News (by aggregator or source name)."""
+    return article.get('aggregator') == 'Google News' or 'Google News' in (article.get('source') or '')
+
+
+def _project_article(article: Dict) -> Dict:
+    """Keep only the article fields the digest uses."""
+    return {k: article[k] for k in DIGEST_ARTICLE_KEYS if k in article}
+
+
+def _card_entities(article: Dict) -> str:
+    """Comma-separated key entities for an article card."""
+    names = (article.get('persons') or []) + (article.get('organizations') or []) + (article.get('locations') or [])
+    if not names:
+        # The preprocessor's regex fallback stores a flat 'entities' list
+        entities = article.get('entities')
+        if isinstance(entities, list):
+            names = entities
+    return ', '.join(names[:MAX_CARD_ENTITIES]) or 'Not available'
+
+
+def _sentiment_breakdown(articles: List[Dict]) -> str:
+    """Sentiment split of a topic as percentages, e.g. '60% Negative, 40% Neutral'."""
+    counts = Counter(a.get('sentiment_category') or 'unknown' for a in articles)
+    total = len(articles)
+    return ', '.join(
+        f"{round(100 * count / total)}% {label.title()}"
+        for label, count in counts.most_common()
+    )
 
 
 def get_analysis_results(tool_context: ToolContext) -> Dict:
@@ -21,37 +115,30 @@ def get_analysis_results(tool_context: ToolContext) -> Dict:
         Dictionary containing all analysis data for digest creation
     """
     # Get all analysis results from state
-    bias_analyzed_articles = tool_context.state.get('bias_analyzed_articles', [])
+    bias_analyzed_articles = _latest_articles(tool_context.state)
     sentiment_stats = tool_context.state.get('sentiment_stats', {})
     bias_analysis = tool_context.state.get('bias_analysis', {})
     top_keywords = tool_context.state.get('top_keywords', [])
     credibility_stats = tool_context.state.get('credibility_stats', {})
     flagged_claims = tool_context.state.get('flagged_claims', [])
 
-    # Also check earlier stages if final analysis is missing
-    if not bias_analyzed_articles:
-        bias_analyzed_articles = tool_context.state.get('nlp_analyzed_articles', [])
-    if not bias_analyzed_articles:
-        bias_analyzed_articles = tool_context.state.get('fact_checked_articles', [])
-    if not bias_analyzed_articles:
-        bias_analyzed_articles = tool_context.state.get('preprocessed_articles', [])
-    if not bias_analyzed_articles:
-        bias_analyzed_articles = tool_context.state.get('collected_articles', [])
-
-    # Count articles by aggregator
-    google_news_articles = [
-        a for a in bias_analyzed_articles
-        if isinstance(a, dict) and a.get('aggregator') == 'Google News'
-    ]
-
-    # Extract unique original sources for diversity analysis
+    # One pass: count Google News articles, collect their original sources
+    # for diversity analysis, and project the articles handed to the model
+    google_news_count = 0
     original_sources = set()
-    for article in google_news_articles:
-        if isinstance(article, dict):
+    report_articles = []
+    for article in bias_analyzed_articles:
+        if not isinstance(article, dict):
+            continue
+
+        if _is_google_news(article):
+            google_news_count += 1
             original_source = article.get('original_source', 'Unknown')
             if original_source and original_source != 'Unknown':
                 original_sources.add(original_source)
 
+        report_articles.append(_project_article(article))
+
     # Get current date for digest header
     current_date = datetime.now().strftime('%Y-%m-%d')
 
@@ -59,13 +146,120 @@ def get_analysis_results(tool_context: ToolContext) -> Dict:
         'success': True,
         'current_date': current_date,
         'total_articles': len(bias_analyzed_articles),
-        'google_news_count': len(google_news_articles),
+        'google_news_count': google_news_count,
         'original_sources': sorted(list(original_sources)),
         'source_diversity': len(original_sources),
-        'articles': bias_analyzed_articles,
+        'articles': report_articles,
         'sentiment_stats': sentiment_stats,
         'bias_analysis': bias_analysis,
         'top_keywords': top_keywords,
         'credibility_stats': credibility_stats,
         'flagged_claims': flagged_claims,
     }
+
+
+def render_digest(
+    executive_summary: str,
+    key_themes: str,
+    article_summaries: List[str],
+    credibility_interpretation: str,
+    framing_examples: List[str],
+    bottom_line: str,
+    perspective_differences: str,
+    reading_recommendations: str,
+    tool_context: ToolContext
+) -> Dict:
+    """
+    Render the HTML daily digest from the written prose and the analysis data.
+
+    Everything that can be computed (date, counts, article cards, sentiment
+    and credibility breakdowns) is filled in here; the model only supplies
+    the prose. The result is stored in state['daily_digest'] for delivery.
+
+    Args:
+        executive_summary: 2-3 sentences describing the news landscape
+        key_themes: Short comma-separated list of the day's themes
+        article_summaries: 2-3 sentence summary per article, in the same order
+            as the 'articles' list returned by get_analysis_results
+        credibility_interpretation: Brief interpretation of the credibility data
+        framing_examples: 2-3 examples of how sources frame the same story
+        bottom_line: 2-3 sentences with the key takeaways
+        perspective_differences: Notable perspective differences between sources
+        reading_recommendations: Articles worth reading further
+        tool_context: ADK tool context with all analysis results in state
+
+    Returns:
+        Dictionary with render status and the digest size
+    """
+    state = tool_context.state
+    articles = [_project_article(a) for a in _latest_articles(state) if isinstance(a, dict)]
+
+    if not articles:
+        return {
+            'success': False,
+            'error': 'No analyzed articles found in state. Run the pipeline first.'
+        }
+
+    # Group article cards by category, keeping the order articles arrived in
+    topics = {}
+    for i, article in enumerate(articles):
+        summary = article_summaries[i] if i < len(article_summaries) else ''
+        polarity = article.get('sentiment_polarity')
+        credibility = article.get('credibility_score')
+        card = {
+            'title': article.get('title') or 'Untitled',
+            'source': article.get('original_source') or article.get('source') or 'Unknown',
+            'url': article.get('url'),
+            'summary': summary or article.get('description') or 'Not available',
+            'sentiment': (
+                f"{article.get('sentiment_category', 'unknown')} ({polarity:.2f})"
+                if isinstance(polarity, (int, float)) else 'Not available'
+            ),
+            'credibility': f"{credibility}/100" if credibility is not None else 'Not available',
+            'entities': _card_entities(article),
+            'sentiment_category': article.get('sentiment_category'),
+        }
+        category = article.get('category') or 'other'
+        topics.setdefault(category, []).append(card)
+
+    topic_list = [
+        {
+            'heading': TOPIC_HEADINGS.get(category, category.title()),
+            'articles': cards,
+            'sentiment_breakdown': _sentiment_breakdown(cards),
+        }
+        for category, cards in topics.items()
+    ]
+
+    credibility_stats = state.get('credibility_stats', {})
+    scores = [a['credibility_score'] for a in articles if a.get('credibility_score') is not None]
+    flagged_claims = state.get('flagged_claims', [])
+
+    digest_html = _TEMPLATE_ENV.get_template('digest.html.j2').render(
+        current_date=datetime.now().strftime('%Y-%m-%d'),
+        total_articles=len(articles),
+        executive_summary=executive_summary,
+        key_themes=key_themes or 'Not available',
+        topics=topic_list,
+        topics_by_count=sorted(topic_list, key=lambda t: len(t['articles']), reverse=True),
+        credibility_distribution=(
+            f"{credibility_stats.get('high_credibility', 0)} high, "
+            f"{credibility_stats.get('medium_credibility', 0)} medium, "
+            f"{credibility_stats.get('low_credibility', 0)} low"
+        ),
+        average_credibility=f"{sum(scores) / len(scores):.1f}/100" if scores else 'Not available',
+        flagged_summary=f"{len(flagged_claims)} claims" if flagged_claims else 'None',
+        credibility_interpretation=credibility_interpretation,
+        framing_examples=framing_examples,
+        bottom_line=bottom_line,
+        perspective_differences=perspective_differences or 'Not available',
+        reading_recommendations=reading_recommendations or 'Not available',
+    )
+
+    state['daily_digest'] = digest_html
+
+    return {
+        'success': True,
+        'rendered_articles': len(articles),
+        'digest_length': len(digest_html),
+    }
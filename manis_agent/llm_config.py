@@ -11,3 +11,21 @@ from google.adk.models.lite_llm import LiteLlm
 LLMRegistry._register(r'.*', LiteLlm)
 
 print("[LLM Config] LiteLLM registered for OpenRouter and other providers")
+
+# Cache breakpoint on the system message, which carries the agent instruction.
+# The instruction is identical on every step, so providers with prompt caching
+# (Anthropic, Gemini via OpenRouter) bill it at the cached rate after the first call.
+SYSTEM_PROMPT_CACHE_POINTS = [{'location': 'message', 'role': 'system'}]
+
+
+def cached_model(model: str) -> LiteLlm:
+    """
+    Build a LiteLLM model that marks the agent instruction as cacheable.
+
+    Args:
+        model: LiteLLM model name (e.g. "openrouter/google/gemini-2.5-flash")
+
+    Returns:
+        LiteLlm instance to pass as an Agent's model
+    """
+    return LiteLlm(model=model, cache_control_injection_points=SYSTEM_PROMPT_CACHE_POINTS)
@@ -6,9 +6,18 @@ Runs the full MANIS pipeline using ADK Runner
 
 import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
+# uvloop (libuv-based event loop) speeds up the many awaited network calls
+# of a run; without it the standard asyncio loop is used
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -17,35 +26,67 @@ env_file = Path(__file__).parent / "manis_agent" / ".env"
 load_dotenv(env_file)
 print(f"Loaded environment from: {env_file}")
 
-from manis_agent.agent import root_agent
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
+# ADK and the agent graph (spaCy, feedparser, ...) are imported inside the
+# functions that need them, so importing this module stays cheap
+
+
+def build_runner():
+    """
+    Build the session service and ADK runner for the MANIS agent graph.
+
+    Most callers want get_runner(), which builds them once per process.
+
+    Returns:
+        Tuple of (runner, session_service)
+    """
+    from manis_agent.agent import root_agent
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+
+    session_service = InMemorySessionService()
+    runner = Runner(
+        agent=root_agent,
+        app_name="MANIS",
+        session_service=session_service,
+    )
+    return runner, session_service
+
+
+@lru_cache(maxsize=None)
+def get_runner():
+    """
+    Get the process-wide runner and session service, building them on first use.
+
+    Returns:
+        Tuple of (runner, session_service)
+    """
+    return build_runner()
 
 
-async def run_pipeline_async():
-    """Execute the MANIS pipeline asynchronously"""
+async def run_pipeline_async(runner=None, session_service=None):
+    """
+    Execute the MANIS pipeline asynchronously
+
+    Args:
+        runner: Optional ADK Runner (defaults to the shared get_runner() one)
+        session_service: Session service the runner was built with
+    """
+    from google.genai import types
+
     print("=" * 80)
     print("Starting MANIS Pipeline")
     print("=" * 80)
 
-    # Create session service
-    session_service = InMemorySessionService()
+    if runner is None or session_service is None:
+        runner, session_service = get_runner()
 
-    # Create session
+    # Each run gets a fresh session so state never leaks between digests
     session = session_service.create_session(
         app_name="MANIS",
         user_id="automated",
         state={}
     )
 
-    # Create runner
-    runner = Runner(
-        agent=root_agent,
-        app_name="MANIS",
-        session_service=session_service,
-    )
-
     # Run the pipeline
     prompt = "Collect, analyze, and deliver today's news intelligence report"
     print(f"\nExecuting: {prompt}\n")
@@ -62,8 +103,9 @@ async def run_pipeline_async():
         # Print event information
         if event.content and event.content.parts:
             for part in event.content.parts:
-                if hasattr(part, "text") and part.text:
-                    print(f"[{event.author}] {part.text}")
+                text = getattr(part, "text", None)
+                if text:
+                    print(f"[{event.author}] {text}")
 
     print("\n" + "=" * 80)
     print("Pipeline Completed Successfully")
@@ -75,7 +117,10 @@ async def run_pipeline_async():
 def main():
     """Main entry point"""
     try:
-        asyncio.run(run_pipeline_async())
+        if UVLOOP_AVAILABLE:
+            uvloop.run(run_pipeline_async())
+        else:
+            asyncio.run(run_pipeline_async())
         sys.exit(0)
     except Exception as e:
         print(f"\n✗ Pipeline failed: {str(e)}", file=sys.stderr)
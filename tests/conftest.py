@@ -1,16 +1,26 @@
 """Shared pytest fixtures for MANIS tests."""
 
 import pytest
-from unittest.mock import Mock
 from datetime import datetime, timezone
+from types import SimpleNamespace
+
+# One timestamp for the whole run so every fixture agrees on "now"
+_NOW = datetime.now(timezone.utc)
+
+
+class MockToolContext:
+    """Stand-in for ADK's ToolContext; the tools only ever touch .state."""
+
+    __slots__ = ('state',)
+
+    def __init__(self):
+        self.state = {}
 
 
 @pytest.fixture
 def mock_tool_context():
     """Create a mock ToolContext with state dictionary."""
-    context = Mock()
-    context.state = {}
-    return context
+    return MockToolContext()
 
 
 @pytest.fixture
@@ -20,7 +30,7 @@ def sample_article():
         'title': 'Test Article: Breaking News',
         'url': 'https://example.com/article/123',
         'source': 'Reuters',
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': _NOW.isoformat(),
         'text': 'This is a test article about important news. It contains multiple sentences for testing.',
         'description': 'Test article description',
         'region': 'US',
@@ -81,14 +91,14 @@ def mock_rss_feed_data():
                 'title': 'RSS Test Article 1',
                 'link': 'https://news.example.com/1',
                 'summary': 'First test article summary',
-                'published_parsed': datetime.now(timezone.utc).timetuple(),
+                'published_parsed': _NOW.timetuple(),
                 'source': {'title': 'Test News Source'}
             },
             {
                 'title': 'RSS Test Article 2',
                 'link': 'https://news.example.com/2',
                 'summary': 'Second test article summary',
-                'published_parsed': datetime.now(timezone.utc).timetuple(),
+                'published_parsed': _NOW.timetuple(),
                 'source': {'title': 'Test News Source'}
             }
         ],
@@ -97,3 +107,9 @@ def mock_rss_feed_data():
             'link': 'https://news.example.com'
         }
     }
+
+
+@pytest.fixture
+def mock_rss_entries(mock_rss_feed_data):
+    """Mock RSS feed entries as objects, the way feedparser exposes them."""
+    return [SimpleNamespace(**item) for item in mock_rss_feed_data['entries']]
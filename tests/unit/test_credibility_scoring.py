@@ -1,21 +1,34 @@
 """Unit tests for fact checker credibility scoring tools."""
 
 import pytest
-from unittest.mock import Mock
 from manis_agent.agents.fact_checker.tools import (
     score_article_credibility,
     flag_dubious_claims,
     SOURCE_CREDIBILITY
 )
 
+# Key sources checked against the credibility database (those not in it are skipped)
+_CRED_SOURCES = [
+    s for s in ['Reuters', 'AP', 'BBC', 'NPR', 'CNN', 'Fox News', 'The Guardian']
+    if s in SOURCE_CREDIBILITY
+]
+
 
 class TestScoreArticleCredibility:
     """Tests for score_article_credibility function."""
 
-    def test_score_known_source_reuters(self, mock_tool_context, preprocessed_article):
-        """Test that Reuters gets correct high credibility score."""
+    @pytest.mark.parametrize('source,expected_credibility,expected_bias,expected_rating', [
+        ('Reuters', 90, 1, 'very high'),
+        ('The New York Times', 78, 4, 'high'),
+        ('reuters', 90, 1, 'very high'),  # lookup ignores case
+        ('A.P.', 90, 1, 'very high'),  # ... and periods
+        ('Random Unknown Blog', 60, 5, 'unknown'),  # unknown sources get the defaults
+    ])
+    def test_score_source(self, source, expected_credibility, expected_bias, expected_rating,
+                          mock_tool_context, preprocessed_article):
+        """Test that each source gets its database (or default) credibility entry."""
         # Setup
-        preprocessed_article['source'] = 'Reuters'
+        preprocessed_article['source'] = source
         mock_tool_context.state['preprocessed_articles'] = [preprocessed_article]
 
         # Execute
@@ -26,40 +39,10 @@ class TestScoreArticleCredibility:
         assert result['scored_count'] == 1
         assert 'credibility_stats' in result
 
-        # Check Reuters score
-        scored_article = mock_tool_context.state['fact_checked_articles'][0]
-        assert scored_article['credibility_score'] == 90
-        assert scored_article['bias_score'] == 1
-        assert scored_article['fact_accuracy_rating'] == 'very high'
-
-    def test_score_known_source_nyt(self, mock_tool_context, preprocessed_article):
-        """Test that NYT gets correct medium-high credibility score."""
-        # Setup
-        preprocessed_article['source'] = 'The New York Times'
-        mock_tool_context.state['preprocessed_articles'] = [preprocessed_article]
-
-        # Execute
-        result = score_article_credibility(mock_tool_context)
-
-        # Assert
-        scored_article = mock_tool_context.state['fact_checked_articles'][0]
-        assert scored_article['credibility_score'] == 78
-        assert scored_article['bias_score'] == 4
-
-    def test_score_unknown_source_defaults(self, mock_tool_context, preprocessed_article):
-        """Test that unknown sources get default score of 60."""
-        # Setup
-        preprocessed_article['source'] = 'Random Unknown Blog'
-        mock_tool_context.state['preprocessed_articles'] = [preprocessed_article]
-
-        # Execute
-        result = score_article_credibility(mock_tool_context)
-
-        # Assert
         scored_article = mock_tool_context.state['fact_checked_articles'][0]
-        assert scored_article['credibility_score'] == 60
-        assert scored_article['bias_score'] == 5
-        assert scored_article['fact_accuracy_rating'] == 'unknown'
+        assert scored_article['credibility_score'] == expected_credibility
+        assert scored_article['bias_score'] == expected_bias
+        assert scored_article['fact_accuracy_rating'] == expected_rating
 
     def test_credibility_stats_calculation(self, mock_tool_context, sample_articles):
         """Test that credibility stats are calculated correctly."""
@@ -101,9 +84,6 @@ class TestScoreArticleCredibility:
 
     def test_no_preprocessed_articles_error(self, mock_tool_context):
         """Test that missing preprocessed articles returns error."""
-        # Setup - empty state
-        mock_tool_context.state = {}
-
         # Execute
         result = score_article_credibility(mock_tool_context)
 
@@ -125,24 +105,18 @@ class TestScoreArticleCredibility:
         assert 'credibility_stats' in mock_tool_context.state
         assert len(mock_tool_context.state['fact_checked_articles']) == 1
 
-    def test_all_credibility_database_sources(self, mock_tool_context, preprocessed_article):
+    @pytest.mark.parametrize('source', _CRED_SOURCES)
+    def test_all_credibility_database_sources(self, source, mock_tool_context, preprocessed_article):
         """Test that all sources in credibility database are handled."""
-        # Test a few key sources
-        test_sources = ['Reuters', 'AP', 'BBC', 'NPR', 'CNN', 'Fox News', 'The Guardian']
-
-        for source in test_sources:
-            if source not in SOURCE_CREDIBILITY:
-                continue  # Skip if not in database
-
-            preprocessed_article['source'] = source
-            mock_tool_context.state['preprocessed_articles'] = [preprocessed_article]
+        preprocessed_article['source'] = source
+        mock_tool_context.state['preprocessed_articles'] = [preprocessed_article]
 
-            result = score_article_credibility(mock_tool_context)
+        result = score_article_credibility(mock_tool_context)
 
-            assert result['success'] is True
-            scored_article = mock_tool_context.state['fact_checked_articles'][0]
-            assert scored_article['credibility_score'] > 0
-            assert scored_article['bias_score'] > 0
+        assert result['success'] is True
+        scored_article = mock_tool_context.state['fact_checked_articles'][0]
+        assert scored_article['credibility_score'] > 0
+        assert scored_article['bias_score'] > 0
 
 
 class TestFlagDubiousClaims:
@@ -167,11 +141,29 @@ class TestFlagDubiousClaims:
         assert len(flagged) > 0
         assert any('allegedly' in f['claim'].lower() for f in flagged)
 
+    @pytest.mark.parametrize('claim,flagged', [
+        ('Officials REPORTEDLY met on Monday', True),
+        ('Sources say the deal is close', True),
+        ('The source spoke anonymously', True),
+        ('The minister made unconfirmed remarks', True),
+        ('The bill passed the Senate on Tuesday', False),
+        ('Sources said the vote was delayed', False),
+    ])
+    def test_verification_keyword_matching(self, claim, flagged, mock_tool_context, fact_checked_article):
+        """Test which claims are flagged by the verification keyword scan."""
+        # Setup - low-bias source so only keywords can flag a claim
+        fact_checked_article['claims'] = [claim]
+        fact_checked_article['bias_score'] = 1
+        mock_tool_context.state['fact_checked_articles'] = [fact_checked_article]
+
+        # Execute
+        result = flag_dubious_claims(mock_tool_context)
+
+        # Assert
+        assert result['flagged_count'] == (1 if flagged else 0)
+
     def test_no_fact_checked_articles_error(self, mock_tool_context):
         """Test that missing fact-checked articles returns error."""
-        # Setup
-        mock_tool_context.state = {}
-
         # Execute
         result = flag_dubious_claims(mock_tool_context)
 
@@ -192,3 +184,21 @@ class TestFlagDubiousClaims:
         # Assert - should have low or zero flagged claims
         assert result['success'] is True
         assert result['flagged_count'] == 0
+
+    def test_high_bias_source_flags_all_claims(self, mock_tool_context, fact_checked_article):
+        """Test that every claim from a high-bias source is flagged."""
+        # Setup
+        fact_checked_article['claims'] = [
+            'This is allegedly a major development',
+            'This is a factual statement'
+        ]
+        fact_checked_article['bias_score'] = 8
+        mock_tool_context.state['fact_checked_articles'] = [fact_checked_article]
+
+        # Execute
+        result = flag_dubious_claims(mock_tool_context)
+
+        # Assert
+        assert result['flagged_count'] == 2
+        flagged = mock_tool_context.state['flagged_claims']
+        assert all(f['reason'] == 'high_bias_source' for f in flagged)
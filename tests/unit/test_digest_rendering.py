@@ -0,0 +1,91 @@
+"""Unit tests for summarizer digest rendering."""
+
+from manis_agent.agents.summarizer.tools import render_digest
+
+
+def _render(context, **overrides):
+    """Call render_digest with filler prose unless overridden."""
+    prose = {
+        'executive_summary': 'A busy news day.',
+        'key_themes': 'Elections, AI',
+        'article_summaries': [],
+        'credibility_interpretation': 'Sources were mostly reliable.',
+        'framing_examples': [],
+        'bottom_line': 'Stay informed.',
+        'perspective_differences': '',
+        'reading_recommendations': '',
+    }
+    prose.update(overrides)
+    return render_digest(tool_context=context, **prose)
+
+
+class TestRenderDigest:
+    """Tests for render_digest function."""
+
+    def test_digest_stored_in_state(self, mock_tool_context, sample_articles):
+        """Test that the rendered HTML is written to state for delivery."""
+        # Setup
+        mock_tool_context.state['bias_analyzed_articles'] = sample_articles
+
+        # Execute
+        result = _render(mock_tool_context, article_summaries=['First summary.'])
+
+        # Assert
+        assert result['success'] is True
+        assert result['rendered_articles'] == 3
+        digest = mock_tool_context.state['daily_digest']
+        assert digest.startswith('<!DOCTYPE html>')
+        assert digest.rstrip().endswith('</html>')
+        assert 'First summary.' in digest
+        assert 'US Politics (3 articles)' in digest
+
+    def test_missing_summary_falls_back_to_description(self, mock_tool_context, sample_article):
+        """Test that articles without a written summary show their description."""
+        # Setup
+        mock_tool_context.state['bias_analyzed_articles'] = [sample_article]
+
+        # Execute
+        _render(mock_tool_context)
+
+        # Assert
+        assert 'Test article description' in mock_tool_context.state['daily_digest']
+
+    def test_fallback_entities_shown_on_card(self, mock_tool_context, sample_article):
+        """Test that the regex fallback's flat entity list is shown when spaCy is unavailable."""
+        # Setup - no categorized entities, only the fallback list
+        sample_article.update({
+            'persons': [],
+            'organizations': [],
+            'locations': [],
+            'entities': ['Joe Biden', 'Acme Corp'],
+        })
+        mock_tool_context.state['bias_analyzed_articles'] = [sample_article]
+
+        # Execute
+        _render(mock_tool_context)
+
+        # Assert
+        assert 'Joe Biden, Acme Corp' in mock_tool_context.state['daily_digest']
+
+    def test_article_text_is_escaped(self, mock_tool_context, sample_article):
+        """Test that markup in article fields cannot break the digest HTML."""
+        # Setup
+        sample_article['title'] = '<script>alert(1)</script>'
+        mock_tool_context.state['bias_analyzed_articles'] = [sample_article]
+
+        # Execute
+        _render(mock_tool_context)
+
+        # Assert
+        digest = mock_tool_context.state['daily_digest']
+        assert '<script>' not in digest
+        assert '&lt;script&gt;' in digest
+
+    def test_no_articles_error(self, mock_tool_context):
+        """Test that an empty state returns an error instead of an empty digest."""
+        # Execute
+        result = _render(mock_tool_context)
+
+        # Assert
+        assert result['success'] is False
+        assert 'daily_digest' not in mock_tool_context.state
@@ -2,96 +2,118 @@
 
 import pytest
 import smtplib
+from types import MappingProxyType
 from unittest.mock import Mock, patch, MagicMock
-import os
-from manis_agent.agents.delivery.tools import send_email_digest, send_via_smtp
+from manis_agent.agents.delivery import tools as delivery_tools
+from manis_agent.agents.delivery.tools import send_email_digest, send_via_smtp, _close_smtp
+
+# Environment for a fully configured SMTP send, shared read-only by the tests
+_STANDARD_ENV = MappingProxyType({
+    'RECIPIENT_EMAIL': 'recipient@example.com',
+    'GMAIL_ADDRESS': 'sender@gmail.com',
+    'GMAIL_APP_PASSWORD': 'test password'
+})
+
+
+@pytest.fixture(autouse=True)
+def reset_smtp_pool():
+    """Drop any pooled SMTP connection between tests."""
+    _close_smtp()
+    yield
+    _close_smtp()
 
 
 class TestSendEmailDigest:
     """Tests for send_email_digest function."""
 
-    def test_send_email_missing_recipient(self, mock_tool_context):
-        """Test that missing RECIPIENT_EMAIL returns error."""
+    @pytest.fixture
+    def mock_smtp(self, monkeypatch):
+        """Replace send_via_smtp on the delivery module with a mock."""
+        mock = MagicMock(return_value={'success': True})
+        monkeypatch.setattr(delivery_tools, 'send_via_smtp', mock)
+        return mock
+
+    @pytest.fixture
+    def mock_api(self, monkeypatch):
+        """Replace send_via_gmail_api on the delivery module with a mock."""
+        mock = MagicMock(return_value={'success': True, 'method': 'gmail_api'})
+        monkeypatch.setattr(delivery_tools, 'send_via_gmail_api', mock)
+        return mock
+
+    @pytest.fixture
+    def standard_env(self, monkeypatch):
+        """Set the recipient and SMTP credentials from _STANDARD_ENV."""
+        for name, value in _STANDARD_ENV.items():
+            monkeypatch.setenv(name, value)
+
+    @pytest.mark.parametrize('env_vars,digest,expected_error', [
+        ({}, '<html><body>Test digest</body></html>', 'RECIPIENT_EMAIL'),
+        ({'RECIPIENT_EMAIL': 'test@example.com'}, None, 'No daily digest'),
+    ], ids=['missing_recipient', 'missing_digest'])
+    def test_send_email_missing_input(self, env_vars, digest, expected_error, mock_tool_context, monkeypatch):
+        """Test that a missing recipient or digest returns an error."""
         # Setup
-        mock_tool_context.state['daily_digest'] = '<html><body>Test digest</body></html>'
+        if digest is not None:
+            mock_tool_context.state['daily_digest'] = digest
 
-        with patch.dict(os.environ, {}, clear=True):
-            # Execute
-            result = send_email_digest(mock_tool_context)
+        for name in ('RECIPIENT_EMAIL', 'GMAIL_ADDRESS', 'GMAIL_APP_PASSWORD'):
+            monkeypatch.delenv(name, raising=False)
+        for name, value in env_vars.items():
+            monkeypatch.setenv(name, value)
 
-            # Assert
-            assert result['success'] is False
-            assert 'error' in result
-            assert 'RECIPIENT_EMAIL' in result['error']
+        # Execute
+        result = send_email_digest(mock_tool_context)
 
-    def test_send_email_missing_digest(self, mock_tool_context):
-        """Test that missing daily_digest returns error."""
-        # Setup - no digest in state
-        mock_tool_context.state = {}
+        # Assert
+        assert result['success'] is False
+        assert expected_error in result['error']
 
-        with patch.dict(os.environ, {'RECIPIENT_EMAIL': 'test@example.com'}):
-            # Execute
-            result = send_email_digest(mock_tool_context)
-
-            # Assert
-            assert result['success'] is False
-            assert 'error' in result
-            assert 'No daily digest' in result['error']
-
-    def test_send_email_success_via_smtp(self, mock_tool_context):
+    def test_send_email_success_via_smtp(self, mock_tool_context, standard_env, mock_smtp):
         """Test successful email send via SMTP."""
         # Setup
         mock_tool_context.state['daily_digest'] = '<html><body>Test digest</body></html>'
 
-        env_vars = {
-            'RECIPIENT_EMAIL': 'recipient@example.com',
-            'GMAIL_ADDRESS': 'sender@gmail.com',
-            'GMAIL_APP_PASSWORD': 'test password'
+        # Mock successful send
+        mock_smtp.return_value = {
+            'success': True,
+            'method': 'smtp',
+            'recipients': ['recipient@example.com']
         }
 
-        with patch.dict(os.environ, env_vars):
-            with patch('manis_agent.agents.delivery.tools.send_via_smtp') as mock_smtp:
-                # Mock successful send
-                mock_smtp.return_value = {
-                    'success': True,
-                    'method': 'smtp',
-                    'recipients': ['recipient@example.com']
-                }
-
-                # Execute
-                result = send_email_digest(mock_tool_context)
+        # Execute
+        result = send_email_digest(mock_tool_context)
 
-                # Assert
-                assert result['success'] is True
-                assert result['method'] == 'smtp'
-                mock_smtp.assert_called_once()
+        # Assert
+        assert result['success'] is True
+        assert result['method'] == 'smtp'
+        mock_smtp.assert_called_once()
 
-    def test_send_email_cleans_markdown_fences(self, mock_tool_context):
+    def test_send_email_cleans_markdown_fences(self, mock_tool_context, standard_env, mock_smtp):
         """Test that markdown code fences are removed from digest."""
         # Setup - digest with markdown fences
         mock_tool_context.state['daily_digest'] = '```html\n<html><body>Test</body></html>\n```'
 
-        env_vars = {
-            'RECIPIENT_EMAIL': 'recipient@example.com',
-            'GMAIL_ADDRESS': 'sender@gmail.com',
-            'GMAIL_APP_PASSWORD': 'test password'
-        }
+        # Execute
+        send_email_digest(mock_tool_context)
+
+        # Assert - check that cleaned HTML was passed
+        call_args = mock_smtp.call_args
+        digest_arg = call_args.kwargs['digest_html']
+        assert '```' not in digest_arg
+        assert '<html>' in digest_arg
+        assert 'Test' in digest_arg
+
+    def test_send_email_parses_recipient_list(self, mock_tool_context, standard_env, monkeypatch, mock_smtp):
+        """Test that comma-separated recipients are split and blanks dropped."""
+        mock_tool_context.state['daily_digest'] = '<html><body>Test</body></html>'
 
-        with patch.dict(os.environ, env_vars):
-            with patch('manis_agent.agents.delivery.tools.send_via_smtp') as mock_smtp:
-                mock_smtp.return_value = {'success': True}
+        monkeypatch.setenv('RECIPIENT_EMAIL', 'a@example.com, b@example.com,')
 
-                # Execute
-                send_email_digest(mock_tool_context)
+        send_email_digest(mock_tool_context)
 
-                # Assert - check that cleaned HTML was passed
-                call_args = mock_smtp.call_args
-                digest_arg = call_args.kwargs['digest_html']
-                assert '```' not in digest_arg
-                assert '<html>' in digest_arg
-                assert 'Test' in digest_arg
+        assert mock_smtp.call_args.kwargs['recipients'] == ['a@example.com', 'b@example.com']
 
-    def test_send_email_cleans_conversational_text(self, mock_tool_context):
+    def test_send_email_cleans_conversational_text(self, mock_tool_context, standard_env, mock_smtp):
         """Test that conversational text before/after HTML is removed."""
         # Setup - digest with chatter and fences
         mock_tool_context.state['daily_digest'] = """
@@ -111,153 +133,202 @@ class TestSendEmailDigest:
         Hope this helps!
         """
 
-        env_vars = {
-            'RECIPIENT_EMAIL': 'recipient@example.com',
-            'GMAIL_ADDRESS': 'sender@gmail.com',
-            'GMAIL_APP_PASSWORD': 'test password'
-        }
+        # Execute
+        send_email_digest(mock_tool_context)
+
+        # Assert - check that ONLY HTML remains
+        call_args = mock_smtp.call_args
+        digest_arg = call_args.kwargs['digest_html']
+
+        # Should not contain chatter
+        assert "Here is the report" not in digest_arg
+        assert "Hope this helps" not in digest_arg
+        assert "```" not in digest_arg
 
-        with patch.dict(os.environ, env_vars):
-            with patch('manis_agent.agents.delivery.tools.send_via_smtp') as mock_smtp:
-                mock_smtp.return_value = {'success': True}
-
-                # Execute
-                send_email_digest(mock_tool_context)
-
-                # Assert - check that ONLY HTML remains
-                call_args = mock_smtp.call_args
-                digest_arg = call_args.kwargs['digest_html']
-                
-                # Should not contain chatter
-                assert "Here is the report" not in digest_arg
-                assert "Hope this helps" not in digest_arg
-                assert "```" not in digest_arg
-                
-                # Should contain HTML
-                assert "<!DOCTYPE html>" in digest_arg
-                assert "</html>" in digest_arg
-                assert digest_arg.startswith("<!DOCTYPE html>")
-                assert digest_arg.endswith("</html>")
-
-    def test_send_email_fallback_to_api(self, mock_tool_context):
+        # Should contain HTML
+        assert "<!DOCTYPE html>" in digest_arg
+        assert "</html>" in digest_arg
+        assert digest_arg.startswith("<!DOCTYPE html>")
+        assert digest_arg.endswith("</html>")
+
+    def test_send_email_fallback_to_api(self, mock_tool_context, monkeypatch, mock_api):
         """Test fallback to Gmail API when SMTP credentials missing."""
         # Setup
         mock_tool_context.state['daily_digest'] = '<html><body>Test digest</body></html>'
 
         # Only RECIPIENT_EMAIL, no SMTP credentials
-        with patch.dict(os.environ, {'RECIPIENT_EMAIL': 'test@example.com'}, clear=True):
-            with patch('manis_agent.agents.delivery.tools.send_via_gmail_api') as mock_api:
-                mock_api.return_value = {'success': True, 'method': 'gmail_api'}
+        for name in ('RECIPIENT_EMAIL', 'GMAIL_ADDRESS', 'GMAIL_APP_PASSWORD'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('RECIPIENT_EMAIL', 'test@example.com')
 
-                # Execute
-                result = send_email_digest(mock_tool_context)
+        # Execute
+        result = send_email_digest(mock_tool_context)
 
-                # Assert - should use Gmail API
-                mock_api.assert_called_once()
+        # Assert - should use Gmail API
+        mock_api.assert_called_once()
 
 
 class TestSendViaSMTP:
     """Tests for send_via_smtp function."""
 
-    def test_smtp_send_success(self, mock_tool_context):
+    @pytest.fixture
+    def smtp_ssl(self):
+        """Patch smtplib.SMTP_SSL; connecting returns the smtp_server mock."""
+        with patch('manis_agent.agents.delivery.tools.smtplib.SMTP_SSL') as smtp_ssl:
+            smtp_ssl.return_value = MagicMock()
+            yield smtp_ssl
+
+    @pytest.fixture
+    def smtp_server(self, smtp_ssl):
+        """Mock SMTP connection handed out by the patched SMTP_SSL."""
+        return smtp_ssl.return_value
+
+    def test_smtp_send_success(self, mock_tool_context, smtp_server):
         """Test successful SMTP email send."""
         # Setup
         digest_html = '<html><body>Test digest</body></html>'
 
-        with patch('manis_agent.agents.delivery.tools.smtplib.SMTP_SSL') as mock_smtp:
-            # Mock SMTP server
-            mock_server = MagicMock()
-            mock_smtp.return_value.__enter__.return_value = mock_server
-
-            # Execute
-            result = send_via_smtp(
-                gmail_address='sender@gmail.com',
-                gmail_password='test_password',
-                recipients=['recipient@example.com'],
-                digest_html=digest_html,
-                tool_context=mock_tool_context
-            )
-
-            # Assert
-            assert result['success'] is True
-            assert result['method'] == 'smtp'
-            assert 'recipients' in result
-
-            # Verify SMTP methods called
-            mock_server.login.assert_called_once_with('sender@gmail.com', 'test_password')
-            mock_server.send_message.assert_called_once()
-
-    def test_smtp_send_handles_authentication_error(self, mock_tool_context):
+        # Execute
+        result = send_via_smtp(
+            gmail_address='sender@gmail.com',
+            gmail_password='test_password',
+            recipients=['recipient@example.com'],
+            digest_html=digest_html,
+            tool_context=mock_tool_context
+        )
+
+        # Assert
+        assert result['success'] is True
+        assert result['method'] == 'smtp'
+        assert 'recipients' in result
+
+        # Verify SMTP methods called
+        smtp_server.login.assert_called_once_with('sender@gmail.com', 'test_password')
+        smtp_server.send_message.assert_called_once()
+
+    def test_smtp_send_handles_authentication_error(self, mock_tool_context, smtp_server):
         """Test SMTP authentication error handling."""
         # Setup
         digest_html = '<html><body>Test digest</body></html>'
-
-        with patch('manis_agent.agents.delivery.tools.smtplib.SMTP_SSL') as mock_smtp:
-            # Mock authentication error
-            mock_server = MagicMock()
-            mock_server.login.side_effect = smtplib.SMTPAuthenticationError(535, b'Authentication failed')
-            mock_smtp.return_value.__enter__.return_value = mock_server
-
-            # Execute
-            result = send_via_smtp(
-                gmail_address='sender@gmail.com',
-                gmail_password='wrong_password',
-                recipients=['recipient@example.com'],
-                digest_html=digest_html,
-                tool_context=mock_tool_context
-            )
-
-            # Assert
-            assert result['success'] is False
-            assert 'error' in result
-            assert 'Authentication' in result['error'] or 'SMTP' in result['error']
-
-    def test_smtp_send_updates_state(self, mock_tool_context):
+        smtp_server.login.side_effect = smtplib.SMTPAuthenticationError(535, b'Authentication failed')
+
+        # Execute
+        result = send_via_smtp(
+            gmail_address='sender@gmail.com',
+            gmail_password='wrong_password',
+            recipients=['recipient@example.com'],
+            digest_html=digest_html,
+            tool_context=mock_tool_context
+        )
+
+        # Assert
+        assert result['success'] is False
+        assert 'error' in result
+        assert 'Authentication' in result['error'] or 'SMTP' in result['error']
+
+    def test_smtp_send_updates_state(self, mock_tool_context, smtp_server):
         """Test that state is updated after successful send."""
         # Setup
         digest_html = '<html><body>Test digest</body></html>'
 
-        with patch('manis_agent.agents.delivery.tools.smtplib.SMTP_SSL') as mock_smtp:
-            mock_server = MagicMock()
-            mock_smtp.return_value.__enter__.return_value = mock_server
+        # Execute
+        result = send_via_smtp(
+            gmail_address='sender@gmail.com',
+            gmail_password='test_password',
+            recipients=['recipient@example.com'],
+            digest_html=digest_html,
+            tool_context=mock_tool_context
+        )
 
-            # Execute
-            result = send_via_smtp(
-                gmail_address='sender@gmail.com',
-                gmail_password='test_password',
-                recipients=['recipient@example.com'],
-                digest_html=digest_html,
-                tool_context=mock_tool_context
-            )
-
-            # Assert - state should be updated
-            assert mock_tool_context.state.get('email_sent') is True
-            assert 'email_method' in mock_tool_context.state
+        # Assert - state should be updated
+        assert mock_tool_context.state.get('email_sent') is True
+        assert 'email_method' in mock_tool_context.state
 
-    def test_smtp_message_structure(self, mock_tool_context):
+    def test_smtp_message_structure(self, mock_tool_context, smtp_server):
         """Test that email message is properly structured."""
         # Setup
         digest_html = '<html><body>Test digest</body></html>'
 
-        with patch('manis_agent.agents.delivery.tools.smtplib.SMTP_SSL') as mock_smtp:
-            mock_server = MagicMock()
-            mock_smtp.return_value.__enter__.return_value = mock_server
+        # Execute
+        send_via_smtp(
+            gmail_address='sender@gmail.com',
+            gmail_password='test_password',
+            recipients=['recipient@example.com'],
+            digest_html=digest_html,
+            tool_context=mock_tool_context
+        )
+
+        # Assert - verify message was sent
+        assert smtp_server.send_message.called
+        sent_message = smtp_server.send_message.call_args[0][0]
+
+        # All recipients go in a single transaction
+        assert smtp_server.send_message.call_args.kwargs['to_addrs'] == ['recipient@example.com']
+
+        # Check message headers
+        assert sent_message['From'] == 'sender@gmail.com'
+        assert sent_message['To'] == 'recipient@example.com'
+        assert 'Subject' in sent_message
+        assert 'MANIS' in sent_message['Subject']
+
+    def test_smtp_reuses_live_connection(self, mock_tool_context, smtp_ssl, smtp_server):
+        """Test that back-to-back sends share one login while the connection answers NOOP."""
+        digest_html = '<html><body>Test digest</body></html>'
+        smtp_server.noop.return_value = (250, b'OK')
 
-            # Execute
-            send_via_smtp(
+        for _ in range(2):
+            result = send_via_smtp(
                 gmail_address='sender@gmail.com',
                 gmail_password='test_password',
                 recipients=['recipient@example.com'],
                 digest_html=digest_html,
                 tool_context=mock_tool_context
             )
+            assert result['success'] is True
 
-            # Assert - verify message was sent
-            assert mock_server.send_message.called
-            sent_message = mock_server.send_message.call_args[0][0]
-
-            # Check message headers
-            assert sent_message['From'] == 'sender@gmail.com'
-            assert sent_message['To'] == 'recipient@example.com'
-            assert 'Subject' in sent_message
-            assert 'MANIS' in sent_message['Subject']
+        smtp_ssl.assert_called_once()
+        smtp_server.login.assert_called_once()
+        assert smtp_server.send_message.call_count == 2
+
+
+class TestAuthenticateGmail:
+    """Tests for cached Gmail API credentials."""
+
+    @pytest.fixture(autouse=True)
+    def reset_gmail_cache(self):
+        delivery_tools._gmail_creds = None
+        delivery_tools._gmail_service = None
+        delivery_tools._gmail_service_creds = None
+        yield
+        delivery_tools._gmail_creds = None
+        delivery_tools._gmail_service = None
+        delivery_tools._gmail_service_creds = None
+
+    def test_credentials_loaded_once(self):
+        """Test that token.json is only read while no valid credentials are cached."""
+        pytest.importorskip('google_auth_oauthlib')
+        creds = Mock(valid=True)
+
+        with patch('manis_agent.agents.delivery.tools.os.path.exists', return_value=True), \
+                patch('manis_agent.agents.delivery.tools.Credentials.from_authorized_user_file',
+                      return_value=creds) as mock_load:
+            assert delivery_tools.authenticate_gmail() is creds
+            assert delivery_tools.authenticate_gmail() is creds
+
+        mock_load.assert_called_once()
+
+    def test_service_built_once_per_credentials(self):
+        """Test that the Gmail service is reused for the same credentials and rebuilt for new ones."""
+        pytest.importorskip('googleapiclient')
+        creds, new_creds = Mock(), Mock()
+
+        with patch('manis_agent.agents.delivery.tools.build', side_effect=lambda *a, **kw: Mock()) as mock_build:
+            first = delivery_tools.get_gmail_service(creds)
+            second = delivery_tools.get_gmail_service(creds)
+            rebuilt = delivery_tools.get_gmail_service(new_creds)
+
+        assert first is second
+        assert rebuilt is not first
+        assert mock_build.call_count == 2
+        assert mock_build.call_args.kwargs['credentials'] is new_creds
+        assert mock_build.call_args.kwargs['cache_discovery'] is False
@@ -1,237 +1,706 @@
 """Unit tests for Google News RSS collector tools."""
 
+import asyncio
+import feedparser
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import requests
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime, timedelta, timezone
-from manis_agent.agents.collectors.google_news_collector.tools import fetch_google_news_rss
+from types import SimpleNamespace
+from manis_agent.agents.collectors import _rss_base
+from manis_agent.agents.collectors._http import MAX_RETRIES, USER_AGENT
+from manis_agent.agents.collectors._rss_base import parse_feed_entries, parse_feed_rs, strip_html
+from manis_agent.agents.collectors.google_news_collector import tools as collector_tools
+from manis_agent.agents.collectors.google_news_collector.tools import (
+    fetch_google_news_rss,
+    fetch_google_news_rss_batch,
+    resolve_google_news_url,
+    resolve_google_news_urls,
+    _follow_redirect
+)
+from manis_agent.agents.preprocessor.tools import preprocess_articles
 
+# Publication time for fresh fake entries, taken once for the module
+_PUBLISHED_NOW = datetime.now(timezone.utc).timetuple()
 
-class TestFetchGoogleNewsRSS:
-    """Tests for fetch_google_news_rss function."""
 
-    def test_fetch_google_news_success(self, mock_tool_context, mock_rss_feed_data):
-        """Test successful RSS fetch returns correct structure."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Setup mock feed data - convert dict entries to objects
-            mock_feed = MagicMock()
-            entries = []
-            for item in mock_rss_feed_data['entries']:
-                entry = MagicMock()
-                entry.title = item['title']
-                entry.link = item['link']
-                entry.summary = item['summary']
-                entry.published_parsed = item['published_parsed']
-                entry.source = item['source']
-                entries.append(entry)
-            
-            mock_feed.entries = entries
-            mock_parse.return_value = mock_feed
-
-            # Execute
-            result = fetch_google_news_rss('politics', 5, mock_tool_context)
+def make_entry(title, link, summary, source_title='Test Source', published_parsed=_PUBLISHED_NOW):
+    """Build a fake feed entry with the fields the collector reads."""
+    return SimpleNamespace(
+        title=title,
+        link=link,
+        summary=summary,
+        published_parsed=published_parsed,
+        source={'title': source_title}
+    )
 
-            # Assert
-            assert result['success'] is True
-            # The tool returns 'articles': [] in the return value, but populates state['collected_articles']
-            # So we check 'count' or look at the state
-            assert result['count'] > 0
-            
-            # Check collected articles in state
-            assert 'collected_articles' in mock_tool_context.state
-            assert len(mock_tool_context.state['collected_articles']) > 0
-            
-            article = mock_tool_context.state['collected_articles'][0]
-            assert 'title' in article
-            assert 'url' in article
-            assert 'source' in article
-            assert 'timestamp' in article
-            assert 'category' in article
-            assert article['category'] == 'politics'
-
-    def test_fetch_google_news_invalid_topic(self, mock_tool_context):
-        """Test that invalid topic returns error."""
-        result = fetch_google_news_rss('invalid_topic', 5, mock_tool_context)
 
-        assert result['success'] is False
-        assert 'error' in result
-        assert 'Invalid topic' in result['error']
-        assert result['articles'] == []
+def make_feed(entries):
+    """Wrap entries in a parsed-feed result, as returned by the feed parsers."""
+    return feedparser.FeedParserDict(entries=entries)
+
+
+def _assert_article_shape(article, category):
+    """Assert a collected article has the digest fields and the expected category."""
+    assert {'title', 'url', 'source', 'timestamp', 'category'} <= article.keys()
+    assert article['category'] == category
+
+
+# Twenty fresh entries for the max_articles tests; the collector only reads them
+_MANY_ENTRIES = [
+    make_entry(f'Article {i}', f'https://example.com/{i}', f'Summary {i}')
+    for i in range(20)
+]
+
+
+@pytest.fixture(autouse=True)
+def mock_session():
+    """Stub the shared HTTP session; feed contents come from the patched feed parser."""
+    with patch.object(_rss_base, 'SESSION') as session, \
+            patch.object(_rss_base, 'FEEDPARSER_RS_AVAILABLE', False):
+        session.get.return_value = Mock(status_code=200, content=b'', headers={})
+        yield session
+
+
+@pytest.fixture
+def mock_parse():
+    """Patch the lxml feed parser; tests set the parsed feed on return_value."""
+    with patch.object(_rss_base, 'parse_feed_entries') as parse:
+        yield parse
+
 
-    def test_fetch_google_news_clears_state_on_politics(self, mock_tool_context):
+@pytest.fixture(autouse=True)
+def clear_redirect_cache():
+    """Start every test with an empty redirect cache."""
+    _follow_redirect.cache_clear()
+    yield
+    _follow_redirect.cache_clear()
+
+
+class TestFetchGoogleNewsRSS:
+    """Tests for fetch_google_news_rss function."""
+
+    @pytest.mark.parametrize('topic', ['politics', 'technology', 'europe'])
+    def test_fetch_google_news_success(self, topic, mock_tool_context, mock_rss_entries, mock_parse):
+        """Test successful RSS fetch returns correct structure and updates state."""
+        # Setup
+        mock_parse.return_value = make_feed(mock_rss_entries)
+
+        # Execute
+        result = fetch_google_news_rss(topic, 5, mock_tool_context)
+
+        # Assert
+        assert result['success'] is True
+        # The tool returns 'articles': [] in the return value, but populates state['collected_articles']
+        # So we check 'count' or look at the state
+        assert result['count'] == len(mock_rss_entries)
+
+        # Check collected articles in state
+        assert 'collected_articles' in mock_tool_context.state
+        assert len(mock_tool_context.state['collected_articles']) == len(mock_rss_entries)
+
+        _assert_article_shape(mock_tool_context.state['collected_articles'][0], topic)
+
+    @pytest.mark.parametrize('topic,valid', [
+        ('politics', True),
+        ('technology', True),
+        ('europe', True),
+        ('invalid_topic', False),
+    ])
+    def test_fetch_google_news_topic_validation(self, topic, valid, mock_tool_context, mock_parse):
+        """Test that only the supported topics pass validation."""
+        mock_parse.return_value = make_feed([])
+
+        result = fetch_google_news_rss(topic, 5, mock_tool_context)
+
+        if valid:
+            assert 'Invalid topic' not in result.get('error', '')
+        else:
+            assert result['success'] is False
+            assert 'Invalid topic' in result['error']
+            assert result['articles'] == []
+
+    def test_fetch_google_news_clears_state_on_politics(self, mock_tool_context, mock_parse):
         """Test that fetching politics topic clears collected_articles state."""
         # Setup - add some existing articles
         mock_tool_context.state['collected_articles'] = [{'title': 'Old Article'}]
 
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Setup mock feed
-            mock_feed = MagicMock()
-            mock_feed.entries = []
-            mock_parse.return_value = mock_feed
+        # Setup mock feed
+        mock_parse.return_value = make_feed([])
 
-            # Execute
-            fetch_google_news_rss('politics', 5, mock_tool_context)
+        # Execute
+        fetch_google_news_rss('politics', 5, mock_tool_context)
 
-            # Assert - state should be cleared
-            assert mock_tool_context.state['collected_articles'] == []
+        # Assert - state should be cleared
+        assert mock_tool_context.state['collected_articles'] == []
 
-    def test_fetch_google_news_respects_max_articles(self, mock_tool_context):
+    @pytest.mark.parametrize('max_articles', [1, 5, 10])
+    def test_fetch_google_news_respects_max_articles(self, max_articles, mock_tool_context, mock_parse):
         """Test that max_articles parameter limits results."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Create many mock entries
-            many_entries = []
-            for i in range(20):
-                entry = MagicMock()
-                entry.title = f'Article {i}'
-                entry.link = f'https://example.com/{i}'
-                entry.published_parsed = datetime.now(timezone.utc).timetuple()
-                entry.summary = f'Summary {i}'
-                entry.source = {'title': 'Test Source'}
-                many_entries.append(entry)
-
-            mock_feed = MagicMock()
-            mock_feed.entries = many_entries
-            mock_parse.return_value = mock_feed
-
-            # Execute with max_articles=5
-            result = fetch_google_news_rss('technology', 5, mock_tool_context)
-
-            # Assert - should not exceed max_articles
-            collected = mock_tool_context.state.get('collected_articles', [])
-            assert len(collected) <= 5
-
-    def test_fetch_google_news_handles_network_error(self, mock_tool_context):
-        """Test graceful handling of network errors."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Simulate network error
-            mock_parse.side_effect = Exception('Network error')
-
-            # Execute
-            result = fetch_google_news_rss('politics', 5, mock_tool_context)
+        mock_parse.return_value = make_feed(_MANY_ENTRIES)
 
-            # Assert - should return error response
-            assert result['success'] is False
-            assert 'error' in result
+        # Execute
+        result = fetch_google_news_rss('technology', max_articles, mock_tool_context)
 
-    def test_fetch_google_news_handles_empty_feed(self, mock_tool_context):
-        """Test handling of empty RSS feed."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Setup empty feed
-            mock_feed = MagicMock()
-            mock_feed.entries = []
-            mock_parse.return_value = mock_feed
+        # Assert - should not exceed max_articles, and parsing is bounded too
+        collected = mock_tool_context.state.get('collected_articles', [])
+        assert len(collected) <= max_articles
+        assert mock_parse.call_args.args[1] == max_articles * 3
 
-            # Execute
-            result = fetch_google_news_rss('politics', 5, mock_tool_context)
+    @pytest.mark.parametrize('parse_outcome,expected_error', [
+        (Exception('Network error'), 'Failed to fetch Google News RSS: Network error'),
+        (make_feed([]), 'No entries found'),
+    ], ids=['network_error', 'empty_feed'])
+    def test_fetch_google_news_error_paths(self, parse_outcome, expected_error, mock_tool_context, mock_parse):
+        """Test that network errors and empty feeds return an error response."""
+        # Setup - an exception is raised by the parser, anything else is returned
+        mock_parse.side_effect = [parse_outcome]
 
-            # Assert
-            assert result['success'] is False
-            assert 'error' in result
-            assert 'No entries found' in result['error']
-
-    def test_fetch_google_news_updates_state(self, mock_tool_context):
-        """Test that state is properly updated with collected articles."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Setup mock feed
-            mock_feed = MagicMock()
-            entry = MagicMock()
-            entry.title = 'Test Article'
-            entry.link = 'https://example.com/test'
-            entry.published_parsed = datetime.now(timezone.utc).timetuple()
-            entry.summary = 'Test summary'
-            entry.source = {'title': 'Test Source'}
-            mock_feed.entries = [entry]
-            mock_parse.return_value = mock_feed
-
-            # Execute
-            result = fetch_google_news_rss('technology', 5, mock_tool_context)
-
-            # Assert - state should be updated
-            assert 'collected_articles' in mock_tool_context.state
-            assert len(mock_tool_context.state['collected_articles']) > 0
-
-    def test_fetch_google_news_filters_sports(self, mock_tool_context):
+        # Execute
+        result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        # Assert
+        assert result['success'] is False
+        assert expected_error in result['error']
+
+    def test_fetch_google_news_filters_sports(self, mock_tool_context, mock_parse):
         """Test that sports articles are filtered out from technology topic."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            # Setup mock feed with mix of tech and sports articles
-            mock_feed = MagicMock()
-            
-            # 1. Valid tech article
-            entry1 = MagicMock()
-            entry1.title = 'New AI Model Released'
-            entry1.link = 'https://example.com/ai'
-            entry1.published_parsed = datetime.now(timezone.utc).timetuple()
-            entry1.summary = 'Google releases new AI model.'
-            entry1.source = {'title': 'TechCrunch'}
-            
-            # 2. Sports article (Georgia Tech football)
-            entry2 = MagicMock()
-            entry2.title = 'Georgia Tech Wins Football Game'
-            entry2.link = 'https://example.com/gatech'
-            entry2.published_parsed = datetime.now(timezone.utc).timetuple()
-            entry2.summary = 'The Yellow Jackets scored a touchdown in the final quarter.'
-            entry2.source = {'title': 'ESPN'}
-            
-            # 3. Sports article (Virginia Tech basketball)
-            entry3 = MagicMock()
-            entry3.title = 'Virginia Tech Basketball Schedule'
-            entry3.link = 'https://example.com/vatech'
-            entry3.published_parsed = datetime.now(timezone.utc).timetuple()
-            entry3.summary = 'The Hokies announce their 2026 season roster.'
-            entry3.source = {'title': 'Sports Illustrated'}
-            
-            mock_feed.entries = [entry1, entry2, entry3]
-            mock_parse.return_value = mock_feed
-
-            # Execute
-            result = fetch_google_news_rss('technology', 5, mock_tool_context)
-
-            # Assert
-            assert result['success'] is True
-            
-            # Should have only 1 article (the AI one)
-            # The tool updates state['collected_articles'], and returns empty list in result['articles']
-            # But it returns 'count' in the result dict
-            assert result['count'] == 1
-            
-            collected = mock_tool_context.state['collected_articles']
-            assert len(collected) == 1
-            assert collected[0]['title'] == 'New AI Model Released'
-
-    def test_fetch_google_news_all_topics(self, mock_tool_context):
-        """Test that all valid topics work correctly."""
-        valid_topics = ['politics', 'technology', 'europe']
-
-        for topic in valid_topics:
-            with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-                # Setup mock feed
-                mock_feed = MagicMock()
-                mock_feed.entries = []
-                mock_parse.return_value = mock_feed
-
-                # Execute
-                result = fetch_google_news_rss(topic, 5, mock_tool_context)
-
-                # Assert - should not fail validation
-                assert 'error' not in result or 'Invalid topic' not in result.get('error', '')
-
-    def test_fetch_google_news_sets_original_source_and_region(self, mock_tool_context):
+        # Setup mock feed with mix of tech and sports articles
+
+        # 1. Valid tech article
+        entry1 = make_entry(
+            'New AI Model Released',
+            'https://example.com/ai',
+            'Google releases new AI model.',
+            'TechCrunch'
+        )
+
+        # 2. Sports article (Georgia Tech football)
+        entry2 = make_entry(
+            'Georgia Tech Wins Football Game',
+            'https://example.com/gatech',
+            'The Yellow Jackets scored a touchdown in the final quarter.',
+            'ESPN'
+        )
+
+        # 3. Sports article (Virginia Tech basketball)
+        entry3 = make_entry(
+            'Virginia Tech Basketball Schedule',
+            'https://example.com/vatech',
+            'The Hokies announce their 2026 season roster.',
+            'Sports Illustrated'
+        )
+
+        mock_parse.return_value = make_feed([entry1, entry2, entry3])
+
+        # Execute
+        result = fetch_google_news_rss('technology', 5, mock_tool_context)
+
+        # Assert
+        assert result['success'] is True
+
+        # Should have only 1 article (the AI one)
+        # The tool updates state['collected_articles'], and returns empty list in result['articles']
+        # But it returns 'count' in the result dict
+        assert result['count'] == 1
+
+        collected = mock_tool_context.state['collected_articles']
+        assert len(collected) == 1
+        assert collected[0]['title'] == 'New AI Model Released'
+
+    def test_fetch_google_news_sets_original_source_and_region(self, mock_tool_context, mock_parse):
         """Test that original_source is set and region matches Europe topic."""
-        with patch('manis_agent.agents.collectors.google_news_collector.tools.feedparser.parse') as mock_parse:
-            mock_feed = MagicMock()
-            entry = MagicMock()
-            entry.title = 'EU Parliament Debates AI Act - Reuters'
-            entry.link = 'https://example.com/eu-ai'
-            entry.published_parsed = datetime.now(timezone.utc).timetuple()
-            entry.summary = 'EU lawmakers discuss AI regulation updates.'
-            entry.source = {'title': 'Reuters'}
-            mock_feed.entries = [entry]
-            mock_parse.return_value = mock_feed
-
-            result = fetch_google_news_rss('europe', 5, mock_tool_context)
-
-            assert result['success'] is True
-            collected = mock_tool_context.state.get('collected_articles', [])
-            assert len(collected) == 1
-            article = collected[0]
-            assert article['original_source'] == 'Reuters'
-            assert article['region'] == 'EU/International'
+        entry = make_entry(
+            'EU Parliament Debates AI Act - Reuters',
+            'https://example.com/eu-ai',
+            'EU lawmakers discuss AI regulation updates.',
+            'Reuters'
+        )
+        mock_parse.return_value = make_feed([entry])
+
+        result = fetch_google_news_rss('europe', 5, mock_tool_context)
+
+        assert result['success'] is True
+        collected = mock_tool_context.state.get('collected_articles', [])
+        assert len(collected) == 1
+        article = collected[0]
+        assert article['original_source'] == 'Reuters'
+        assert article['region'] == 'EU/International'
+
+    def test_fetch_google_news_skips_old_entries_without_stopping(self, mock_tool_context, mock_parse):
+        """Test that a stale entry does not hide newer ones later in the relevance-ordered feed."""
+        old_entry = make_entry(
+            'Last Week Story - AP',
+            'https://example.com/old',
+            'Old news.',
+            published_parsed=(datetime.now(timezone.utc) - timedelta(days=5)).timetuple()
+        )
+        new_entry = make_entry('Breaking Story - Reuters', 'https://example.com/new', 'Fresh news.')
+        mock_parse.return_value = make_feed([old_entry, new_entry])
+
+        result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        assert result['count'] == 1
+        assert mock_tool_context.state['collected_articles'][0]['title'] == 'Breaking Story'
+
+    def test_fetch_google_news_skips_entries_without_link(self, mock_tool_context, mock_parse):
+        """Test that entries without a link are dropped before any text cleaning."""
+        with patch.object(collector_tools, 'strip_html', wraps=strip_html) as mock_strip:
+            entry = feedparser.FeedParserDict(
+                title='Orphan Story - AP',
+                summary='<b>No link</b>',
+                published_parsed=_PUBLISHED_NOW
+            )
+            mock_parse.return_value = make_feed([entry])
+
+            result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+            assert result['count'] == 0
+            mock_strip.assert_not_called()
+
+    def test_fetch_google_news_reuses_cache_on_not_modified(self, mock_tool_context, mock_session, mock_parse):
+        """Test that an HTTP 304 reuses the cached articles and sends the stored validators."""
+        # First poll returns a full feed with validators
+        entry = make_entry(
+            'Senate Passes Budget - Reuters',
+            'https://example.com/budget',
+            'The Senate passed the budget.'
+        )
+        mock_parse.return_value = make_feed([entry])
+        mock_session.get.return_value = Mock(
+            status_code=200,
+            content=b'<rss/>',
+            headers={'ETag': '"abc123"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+        )
+
+        fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        # Age the cache past the reuse window so the next call polls again
+        cache_key = next(k for k in mock_tool_context.state if k.startswith('app:rss_cache:'))
+        stale_ts = datetime.now(timezone.utc) - timedelta(minutes=5)
+        mock_tool_context.state[cache_key]['ts'] = stale_ts.isoformat()
+
+        # Second poll: server reports the feed is unchanged
+        mock_session.get.return_value = Mock(status_code=304, content=b'', headers={})
+
+        result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        assert result['success'] is True
+        assert result['count'] == 1
+        assert mock_tool_context.state['collected_articles'][0]['title'] == 'Senate Passes Budget'
+        assert mock_parse.call_count == 1
+        headers = mock_session.get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc123"'
+        assert headers['If-Modified-Since'] == 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+    def test_fetch_google_news_drops_expired_articles_on_not_modified(self, mock_tool_context, mock_session, mock_parse):
+        """Test that cached articles older than 48 hours are not served again on an HTTP 304."""
+        entry = make_entry(
+            'Senate Passes Budget - Reuters',
+            'https://example.com/budget',
+            'The Senate passed the budget.'
+        )
+        mock_parse.return_value = make_feed([entry])
+        mock_session.get.return_value = Mock(status_code=200, content=b'<rss/>', headers={'ETag': '"abc123"'})
+
+        fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        # The feed has not changed for three days
+        cache_key = next(k for k in mock_tool_context.state if k.startswith('app:rss_cache:'))
+        three_days_ago = datetime.now(timezone.utc) - timedelta(days=3)
+        mock_tool_context.state[cache_key]['ts'] = three_days_ago.isoformat()
+        mock_tool_context.state[cache_key]['articles'][0]['timestamp'] = three_days_ago.isoformat()
+        mock_session.get.return_value = Mock(status_code=304, content=b'', headers={})
+
+        result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        assert result['success'] is True
+        assert result['count'] == 0
+        assert mock_tool_context.state['collected_articles'] == []
+
+    def test_fetch_google_news_server_error_keeps_cache(self, mock_tool_context, mock_session, mock_parse):
+        """Test that an HTTP 5xx is reported as an error and leaves the cached feed alone."""
+        entry = make_entry(
+            'Senate Passes Budget - Reuters',
+            'https://example.com/budget',
+            'The Senate passed the budget.'
+        )
+        mock_parse.return_value = make_feed([entry])
+        mock_session.get.return_value = Mock(status_code=200, content=b'<rss/>', headers={'ETag': '"abc123"'})
+
+        fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        cache_key = next(k for k in mock_tool_context.state if k.startswith('app:rss_cache:'))
+        stale_ts = datetime.now(timezone.utc) - timedelta(minutes=5)
+        mock_tool_context.state[cache_key]['ts'] = stale_ts.isoformat()
+        cached = dict(mock_tool_context.state[cache_key])
+        error_response = requests.Response()
+        error_response.status_code = 503
+        error_response.reason = 'Service Unavailable'
+        mock_session.get.return_value = error_response
+
+        result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        assert result['success'] is False
+        assert '503' in result['error']
+        assert mock_parse.call_count == 1
+        assert mock_tool_context.state[cache_key] == cached
+
+    def test_fetch_google_news_reuses_recent_poll_without_fetching(self, mock_tool_context, mock_parse):
+        """Test that a re-run within the reuse window skips the network."""
+        entry = make_entry(
+            'Senate Passes Budget - Reuters',
+            'https://example.com/budget',
+            'The Senate passed the budget.'
+        )
+        mock_parse.return_value = make_feed([entry])
+
+        fetch_google_news_rss('politics', 5, mock_tool_context)
+        result = fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        assert mock_parse.call_count == 1
+        assert result['count'] == 1
+        assert mock_tool_context.state['collected_articles'][0]['title'] == 'Senate Passes Budget'
+
+    def test_fetch_google_news_cache_unaffected_by_later_stages(self, mock_tool_context, mock_parse):
+        """Test that in-place annotations by the preprocessor do not leak into the feed cache."""
+        entry = make_entry(
+            'Senate Passes Budget - Reuters',
+            'https://example.com/budget',
+            'The Senate passed the budget.'
+        )
+        mock_parse.return_value = make_feed([entry])
+
+        fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        # The preprocessor annotates the collected articles in place and drops their text
+        assert preprocess_articles(mock_tool_context)['success'] is True
+        assert 'text' not in mock_tool_context.state['collected_articles'][0]
+
+        fetch_google_news_rss('politics', 5, mock_tool_context)
+
+        reused = mock_tool_context.state['collected_articles'][0]
+        assert reused['text'] == 'The Senate passed the budget.'
+        assert 'claims' not in reused
+
+
+# Feed entries shared by the batch tests
+_SENATE_ENTRY = make_entry('Senate Passes Bill - Reuters', 'https://example.com/senate', 'Senate Passes Bill.')
+_ELECTION_ENTRY = make_entry('Election Update - AP', 'https://example.com/election', 'Election Update.')
+_CHIP_ENTRY = make_entry('New AI Chip Announced - The Verge', 'https://example.com/ai-chip', 'New AI Chip Announced.')
+_SUMMIT_ENTRY = make_entry('EU Summit Opens - BBC', 'https://example.com/eu-summit', 'EU Summit Opens.')
+
+
+class TestFetchGoogleNewsRSSBatch:
+    """Tests for fetch_google_news_rss_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_batch_collects_all_topics(self, mock_tool_context):
+        """Test that one batch call stores articles for every topic."""
+        feeds = [
+            make_feed([_SENATE_ENTRY, _ELECTION_ENTRY]),
+            make_feed([_CHIP_ENTRY]),
+        ]
+
+        with patch.object(collector_tools, 'fetch_all', new=AsyncMock(return_value=feeds)):
+            result = await fetch_google_news_rss_batch(['politics', 'technology'], [4, 3], mock_tool_context)
+
+        assert result['success'] is True
+        assert result['count'] == 3
+        assert result['topics']['politics']['count'] == 2
+        assert result['topics']['technology']['count'] == 1
+
+        collected = mock_tool_context.state['collected_articles']
+        assert [a['category'] for a in collected] == ['politics', 'politics', 'technology']
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_failed_topic(self, mock_tool_context):
+        """Test that a failed download is reported per topic without losing the others."""
+        feeds = [make_feed([_SENATE_ENTRY]), Exception('Network error')]
+
+        with patch.object(collector_tools, 'fetch_all', new=AsyncMock(return_value=feeds)):
+            result = await fetch_google_news_rss_batch(['politics', 'europe'], [4, 4], mock_tool_context)
+
+        assert result['success'] is True
+        assert result['count'] == 1
+        assert result['topics']['europe']['count'] == 0
+        assert 'Network error' in result['topics']['europe']['error']
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_to_thread_pool(self, mock_tool_context, mock_parse):
+        """Test that feeds are fetched in threads when aiohttp is unavailable."""
+        with patch.object(_rss_base, 'AIOHTTP_AVAILABLE', False):
+            mock_parse.side_effect = [
+                make_feed([_SENATE_ENTRY]),
+                make_feed([_SUMMIT_ENTRY]),
+            ]
+
+            result = await fetch_google_news_rss_batch(['politics', 'europe'], [4, 4], mock_tool_context)
+
+        assert result['success'] is True
+        assert result['count'] == 2
+        assert mock_parse.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_only_fetches_stale_feeds(self, mock_tool_context):
+        """Test that topics polled within the reuse window are served from the cache."""
+        fetch_all = AsyncMock(return_value=[make_feed([_SENATE_ENTRY])])
+        with patch.object(collector_tools, 'fetch_all', new=fetch_all):
+            await fetch_google_news_rss_batch(['politics'], [4], mock_tool_context)
+
+            fetch_all.return_value = [make_feed([_SUMMIT_ENTRY])]
+            result = await fetch_google_news_rss_batch(['politics', 'europe'], [4, 4], mock_tool_context)
+
+        assert result['count'] == 2
+        assert fetch_all.await_count == 2
+        # Only the europe feed went to the network on the second run
+        assert len(fetch_all.await_args.args[0]) == 1
+        titles = [a['title'] for a in mock_tool_context.state['collected_articles']]
+        assert titles == ['Senate Passes Bill', 'EU Summit Opens']
+
+    @pytest.mark.asyncio
+    async def test_batch_invalid_topic(self, mock_tool_context):
+        """Test that an invalid topic rejects the whole batch."""
+        result = await fetch_google_news_rss_batch(['politics', 'sports'], [4, 4], mock_tool_context)
+
+        assert result['success'] is False
+        assert 'Invalid topic' in result['error']
+
+
+@pytest.mark.skipif(not _rss_base.AIOHTTP_AVAILABLE, reason='aiohttp not installed')
+class TestFetchFeed:
+    """Tests for the aiohttp feed download used by the batch tool."""
+
+    @staticmethod
+    def _response(status, body=b'', headers=None):
+        response = MagicMock(status=status, headers=headers or {})
+        response.read = AsyncMock(return_value=body)
+        if status >= 400:
+            # Like aiohttp, raise_for_status() raises for error statuses
+            response.raise_for_status.side_effect = _rss_base.aiohttp.ClientResponseError(
+                MagicMock(), (), status=status
+            )
+        return response
+
+    @staticmethod
+    def _session(*outcomes):
+        """Fake aiohttp session whose get() yields each response (or raises each error) in turn."""
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                results.append(outcome)
+            else:
+                request = MagicMock()
+                request.__aenter__.return_value = outcome
+                results.append(request)
+        session = MagicMock()
+        session.get.side_effect = results
+        return session
+
+    @pytest.mark.asyncio
+    async def test_parses_feed_with_validators(self):
+        """Test that a downloaded feed is parsed up to max_entries and carries its validators."""
+        headers = {'ETag': '"abc123"', 'Last-Modified': 'Mon, 13 Oct 2025 14:30:00 GMT'}
+        session = self._session(self._response(200, TestParseFeedEntries.RSS_FEED, headers))
+
+        feed = await _rss_base._fetch_feed(
+            session, asyncio.Semaphore(1), 'https://example.com/rss', {'etag': '"old"'}, 2
+        )
+
+        assert len(feed.entries) == 2
+        assert feed.status == 200
+        assert feed.etag == '"abc123"'
+        assert feed.modified == 'Mon, 13 Oct 2025 14:30:00 GMT'
+        assert session.get.call_args.kwargs['headers'] == {'If-None-Match': '"old"'}
+
+    @pytest.mark.asyncio
+    async def test_not_modified(self):
+        """Test that an HTTP 304 returns the empty not-modified stand-in."""
+        session = self._session(self._response(304))
+
+        feed = await _rss_base._fetch_feed(session, asyncio.Semaphore(1), 'https://example.com/rss', {}, 5)
+
+        assert feed.status == 304
+        assert feed.entries == []
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_errors(self):
+        """Test that connection errors are retried, and re-raised once the retries run out."""
+        with patch.object(_rss_base, 'RETRY_BACKOFF', 0):
+            session = self._session(
+                _rss_base.aiohttp.ClientConnectionError('reset'),
+                self._response(200, TestParseFeedEntries.RSS_FEED)
+            )
+            feed = await _rss_base._fetch_feed(session, asyncio.Semaphore(1), 'https://example.com/rss', {}, 5)
+
+            assert len(feed.entries) == 3
+            assert session.get.call_count == 2
+
+            session = self._session(*[_rss_base.aiohttp.ClientConnectionError('reset')] * (MAX_RETRIES + 1))
+            with pytest.raises(_rss_base.aiohttp.ClientConnectionError):
+                await _rss_base._fetch_feed(session, asyncio.Semaphore(1), 'https://example.com/rss', {}, 5)
+
+    @pytest.mark.asyncio
+    async def test_server_error_raises_without_retry(self):
+        """Test that an HTTP 5xx raises instead of being parsed as an empty feed."""
+        session = self._session(self._response(503), self._response(200, TestParseFeedEntries.RSS_FEED))
+
+        with pytest.raises(_rss_base.aiohttp.ClientResponseError):
+            await _rss_base._fetch_feed(session, asyncio.Semaphore(1), 'https://example.com/rss', {}, 5)
+
+        assert session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_shares_one_identified_session(self):
+        """Test that a batch downloads every feed over one session with the MANIS User-Agent and feed timeout."""
+        with patch.object(_rss_base.aiohttp, 'ClientSession') as client_session, \
+                patch.object(_rss_base, '_fetch_feed', new=AsyncMock(return_value='feed')) as fetch_feed:
+            feeds = await _rss_base.fetch_all(['https://example.com/a', 'https://example.com/b'], [{}, {}], [5, 5])
+
+        assert feeds == ['feed', 'feed']
+        assert client_session.call_count == 1
+        assert client_session.call_args.kwargs['headers'] == {'User-Agent': USER_AGENT}
+        assert client_session.call_args.kwargs['timeout'].total == _rss_base.FEED_TIMEOUT
+        session = client_session.return_value.__aenter__.return_value
+        assert all(call.args[0] is session for call in fetch_feed.call_args_list)
+
+
+class TestParseFeedEntries:
+    """Tests for the streaming lxml feed parser."""
+
+    RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Google News</title>
+<item><title>Senate Passes Bill - Reuters</title><link>https://news.google.com/rss/articles/1</link>
+<pubDate>Mon, 13 Oct 2025 14:30:00 GMT</pubDate>
+<description>&lt;a href="https://example.com"&gt;Senate Passes Bill&lt;/a&gt;</description></item>
+<item><title>Second Story - AP</title><link>https://news.google.com/rss/articles/2</link>
+<pubDate>Mon, 13 Oct 2025 10:00:00 -0400</pubDate></item>
+<item><title>Third Story - BBC</title><link>https://news.google.com/rss/articles/3</link></item>
+</channel></rss>"""
+
+    ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+<entry><title>Atom Story</title><link href="https://example.com/atom"/>
+<updated>2025-10-13T14:30:00Z</updated><summary>Atom summary</summary></entry>
+</feed>"""
+
+    def test_parse_rss_items(self):
+        """Test that RSS items are extracted with feedparser-compatible fields."""
+        feed = parse_feed_entries(self.RSS_FEED, 10)
+
+        assert len(feed.entries) == 3
+        first = feed.entries[0]
+        assert first.title == 'Senate Passes Bill - Reuters'
+        assert first.link == 'https://news.google.com/rss/articles/1'
+        assert '<a href=' in first.summary
+        assert tuple(first.published_parsed[:6]) == (2025, 10, 13, 14, 30, 0)
+
+        # Offsets are normalized to UTC
+        assert tuple(feed.entries[1].published_parsed[:4]) == (2025, 10, 13, 14)
+        assert feed.entries[2].published_parsed is None
+
+    def test_parse_timezone_abbreviations(self):
+        """Test that US and European timezone abbreviations resolve to the right offset."""
+        raw = b"""<rss><channel>
+<item><title>A</title><pubDate>Mon, 13 Oct 2025 10:00:00 EDT</pubDate></item>
+<item><title>B</title><pubDate>Mon, 13 Oct 2025 16:00:00 CEST</pubDate></item>
+</channel></rss>"""
+        feed = parse_feed_entries(raw, 10)
+
+        assert tuple(feed.entries[0].published_parsed[:4]) == (2025, 10, 13, 14)
+        assert tuple(feed.entries[1].published_parsed[:4]) == (2025, 10, 13, 14)
+
+    def test_parse_stops_at_max_entries(self):
+        """Test that parsing stops once max_entries entries were read."""
+        feed = parse_feed_entries(self.RSS_FEED, 2)
+
+        assert [e.title for e in feed.entries] == ['Senate Passes Bill - Reuters', 'Second Story - AP']
+
+    def test_parse_atom_entries(self):
+        """Test that Atom entries are extracted."""
+        feed = parse_feed_entries(self.ATOM_FEED, 10)
+
+        assert len(feed.entries) == 1
+        assert feed.entries[0].link == 'https://example.com/atom'
+        assert feed.entries[0].summary == 'Atom summary'
+        assert tuple(feed.entries[0].published_parsed[:6]) == (2025, 10, 13, 14, 30, 0)
+
+
+class TestResolveGoogleNewsUrls:
+    """Tests for resolve_google_news_urls function."""
+
+    def test_resolves_urls_in_order(self):
+        """Test that concurrently resolved URLs come back in input order."""
+        urls = [f'https://news.google.com/rss/articles/{i}' for i in range(5)]
+
+        with patch.object(collector_tools, 'resolve_google_news_url',
+                          side_effect=lambda url: url.replace('news.google.com/rss/articles', 'example.com')):
+            resolved = resolve_google_news_urls(urls)
+
+        assert resolved == [f'https://example.com/{i}' for i in range(5)]
+
+    def test_remembers_resolved_and_failed_redirects(self):
+        """Test that each redirect is requested once, including ones that failed."""
+        ok_url = 'https://news.google.com/rss/articles/ok'
+        dead_url = 'https://news.google.com/rss/articles/dead'
+
+        def head(url, **kwargs):
+            if url == dead_url:
+                raise Exception('Connection refused')
+            return Mock(url='https://example.com/story')
+
+        with patch.object(collector_tools, 'SESSION') as session:
+            session.head.side_effect = head
+            for _ in range(2):
+                assert resolve_google_news_url(ok_url) == 'https://example.com/story'
+                assert resolve_google_news_url(dead_url) == dead_url
+
+        assert session.head.call_count == 2
+
+    def test_leaves_direct_urls_untouched(self):
+        """Test that non-Google URLs are returned without any request."""
+        urls = ['https://example.com/a', 'https://example.com/b']
+
+        with patch.object(collector_tools, 'SESSION') as session:
+            assert resolve_google_news_urls(urls) == urls
+            session.head.assert_not_called()
+
+
+class TestParseFeedRs:
+    """Tests for the optional feedparser-rs parser."""
+
+    def test_parse_matches_entry_fields(self):
+        """Test that feedparser-rs entries expose the fields the collector reads."""
+        pytest.importorskip('feedparser_rs')
+
+        feed = parse_feed_rs(TestParseFeedEntries.RSS_FEED, 2)
+
+        assert len(feed.entries) == 2
+        first = feed.entries[0]
+        assert first.title == 'Senate Passes Bill - Reuters'
+        assert first.link == 'https://news.google.com/rss/articles/1'
+        assert '<a href=' in first.summary
+        assert tuple(first.published_parsed[:6]) == (2025, 10, 13, 14, 30, 0)
+        assert tuple(feed.entries[1].published_parsed[:4]) == (2025, 10, 13, 14)
+
+        # The wrapper stays mutable so download metadata can be attached
+        feed['status'] = 200
+        assert feed.status == 200
+
+
+class TestStripHtml:
+    """Tests for the HTML description cleaner."""
+
+    def test_strip_google_news_description(self):
+        """Test that a typical Google News description becomes plain text."""
+        description = '<a href="https://example.com" target="_blank">Senate Passes Bill</a>&nbsp;&nbsp;<font color="#6f6f6f">Reuters</font>'
+
+        assert strip_html(description) == 'Senate Passes Bill Reuters'
+
+    def test_strip_unescapes_entities(self):
+        """Test that HTML entities are decoded."""
+        assert strip_html('<p>AT&amp;T &quot;wins&quot;</p>') == 'AT&T "wins"'
+
+    def test_strip_plain_text_unchanged(self):
+        """Test that text without markup is returned as-is."""
+        assert strip_html('Plain summary') == 'Plain summary'
@@ -0,0 +1,208 @@
+"""Unit tests for preprocessor text cleaning and entity extraction tools."""
+
+import pytest
+from collections import OrderedDict
+from manis_agent.agents.preprocessor import tools as preprocessor_tools
+from manis_agent.agents.preprocessor.tools import (
+    extract_entities_batch,
+    extract_simple_entities,
+    preprocess_articles,
+    _pipe_settings
+)
+
+# Texts the stub pipeline recognizes entities in
+_BIDEN_TEXT = 'Joe Biden met Acme Corp executives in Paris.'
+_MACRON_TEXT = 'Emmanuel Macron spoke in Berlin.'
+
+
+class _RecordingNLP:
+    """Wraps a spaCy pipeline and records the texts sent through nlp.pipe."""
+
+    def __init__(self, nlp):
+        self._nlp = nlp
+        self.piped = []
+
+    def __call__(self, text):
+        return self._nlp(text)
+
+    def pipe(self, texts, batch_size, n_process):
+        texts = list(texts)
+        self.piped.append(texts)
+        return self._nlp.pipe(texts, batch_size=batch_size)
+
+
+@pytest.fixture
+def stub_nlp(monkeypatch):
+    """Install a blank English pipeline with a rule-based NER in place of the spaCy model."""
+    spacy = pytest.importorskip('spacy')
+    nlp = spacy.blank('en')
+    nlp.add_pipe('entity_ruler').add_patterns([
+        {'label': 'PERSON', 'pattern': 'Joe Biden'},
+        {'label': 'PERSON', 'pattern': 'Emmanuel Macron'},
+        {'label': 'ORG', 'pattern': 'Acme Corp'},
+        {'label': 'GPE', 'pattern': 'Paris'},
+        {'label': 'GPE', 'pattern': 'Berlin'},
+    ])
+    recording = _RecordingNLP(nlp)
+    monkeypatch.setattr(preprocessor_tools, 'nlp', recording)
+    monkeypatch.setattr(preprocessor_tools, 'SPACY_AVAILABLE', True)
+    monkeypatch.setattr(preprocessor_tools, '_entity_cache', OrderedDict())
+    return recording
+
+
+class TestExtractSimpleEntities:
+    """Tests for the regex fallback entity extraction."""
+
+    @pytest.mark.parametrize('text,expected', [
+        (
+            'Joe Biden met executives from Acme Widgets Inc. on Monday.',
+            ['Joe Biden', 'Acme Widgets Inc', 'Joe Biden met executives from Acme Widgets Inc.'],
+        ),
+        (
+            'Officials at Homeland Security Agency said the plan works.',
+            ['Homeland Security Agency', 'Officials at Homeland Security Agency'],
+        ),
+    ], ids=['name_and_company', 'agency'])
+    def test_names_then_organizations(self, text, expected):
+        """Test that name matches come first and overlapping organization matches are kept."""
+        assert extract_simple_entities(text) == expected
+
+
+class TestExtractEntitiesBatch:
+    """Tests for batched spaCy entity extraction."""
+
+    def test_results_in_input_order(self, stub_nlp):
+        """Test that results line up with the input texts, duplicates included."""
+        results = extract_entities_batch([_BIDEN_TEXT, _MACRON_TEXT, _BIDEN_TEXT])
+
+        assert [r['persons'] for r in results] == [['Joe Biden'], ['Emmanuel Macron'], ['Joe Biden']]
+        assert results[0]['organizations'] == ['Acme Corp']
+        assert results[1]['locations'] == ['Berlin']
+        # The repeated text goes through the model once
+        assert stub_nlp.piped == [[_BIDEN_TEXT, _MACRON_TEXT]]
+
+    def test_recent_texts_served_from_cache(self, stub_nlp):
+        """Test that a text seen recently is not sent through the model again."""
+        extract_entities_batch([_BIDEN_TEXT])
+        results = extract_entities_batch([_MACRON_TEXT, _BIDEN_TEXT])
+
+        assert stub_nlp.piped == [[_BIDEN_TEXT], [_MACRON_TEXT]]
+        assert results[1]['persons'] == ['Joe Biden']
+
+    def test_cached_results_not_shared(self, stub_nlp):
+        """Test that callers get fresh lists, so mutating one never changes the cache."""
+        extract_entities_batch([_BIDEN_TEXT])[0]['persons'].append('Someone Else')
+
+        assert extract_entities_batch([_BIDEN_TEXT])[0]['persons'] == ['Joe Biden']
+
+    def test_cache_evicts_least_recently_used(self, stub_nlp, monkeypatch):
+        """Test that the cache stays bounded and drops the least recently used text."""
+        monkeypatch.setattr(preprocessor_tools, 'ENTITY_CACHE_SIZE', 2)
+        third = 'Joe Biden visited Berlin.'
+
+        extract_entities_batch([_BIDEN_TEXT, _MACRON_TEXT])
+        extract_entities_batch([_BIDEN_TEXT])  # Biden is now the most recent
+        extract_entities_batch([third])
+
+        assert len(preprocessor_tools._entity_cache) == 2
+        extract_entities_batch([_BIDEN_TEXT, _MACRON_TEXT])
+        assert stub_nlp.piped[-1] == [_MACRON_TEXT]
+
+
+class TestPipeSettings:
+    """Tests for choosing nlp.pipe parallelism."""
+
+    def test_small_batch_single_process(self):
+        """Test that a normal digest stays in-process."""
+        assert _pipe_settings(preprocessor_tools.MULTIPROCESS_MIN_TEXTS - 1) == (1, 64)
+
+    def test_large_batch_uses_workers(self, monkeypatch):
+        """Test that large batches are split across up to four worker processes."""
+        monkeypatch.setattr(preprocessor_tools.os, 'name', 'posix')
+        monkeypatch.setattr(preprocessor_tools.os, 'cpu_count', lambda: 8)
+
+        assert _pipe_settings(100) == (4, 25)
+
+    def test_windows_single_process(self, monkeypatch):
+        """Test that Windows never uses worker processes."""
+        monkeypatch.setattr(preprocessor_tools.os, 'name', 'nt')
+
+        assert _pipe_settings(100) == (1, 64)
+
+
+class TestPreprocessArticles:
+    """Tests for preprocess_articles function."""
+
+    def test_annotates_articles(self, mock_tool_context, stub_nlp):
+        """Test that articles are cleaned, tagged, and their raw text dropped."""
+        # Setup
+        mock_tool_context.state['collected_articles'] = [
+            {'title': 'Summit', 'text': f'  {_BIDEN_TEXT}  Officials said talks went well. '}
+        ]
+
+        # Execute
+        result = preprocess_articles(mock_tool_context)
+
+        # Assert
+        assert result['success'] is True
+        article = mock_tool_context.state['preprocessed_articles'][0]
+        assert 'text' not in article
+        assert article['clean_text'].startswith('Joe Biden met')
+        assert article['clean_text_lower'] == article['clean_text'].lower()
+        assert article['persons'] == ['Joe Biden']
+        assert article['claims'] == ['Officials said talks went well']
+
+    def test_empty_article_skips_ner(self, mock_tool_context, stub_nlp):
+        """Test that articles without text get empty results without a model call."""
+        # Setup
+        mock_tool_context.state['collected_articles'] = [{'title': 'No body', 'text': '   '}]
+
+        # Execute
+        preprocess_articles(mock_tool_context)
+
+        # Assert
+        article = mock_tool_context.state['preprocessed_articles'][0]
+        assert article['persons'] == [] and article['claims'] == []
+        assert article['word_count'] == 0
+        assert stub_nlp.piped == []
+
+    def test_second_run_is_noop(self, mock_tool_context, stub_nlp):
+        """Test that re-running over already preprocessed articles changes nothing."""
+        # Setup
+        mock_tool_context.state['collected_articles'] = [
+            {'title': 'Summit', 'text': _BIDEN_TEXT},
+            {'title': 'Speech', 'text': _MACRON_TEXT},
+        ]
+        first = preprocess_articles(mock_tool_context)
+        snapshot = [dict(a) for a in mock_tool_context.state['preprocessed_articles']]
+        # Forget the entity results so only the already-preprocessed check can avoid the model
+        preprocessor_tools._entity_cache.clear()
+
+        # Execute
+        second = preprocess_articles(mock_tool_context)
+
+        # Assert
+        assert second == first
+        assert mock_tool_context.state['preprocessed_articles'] == snapshot
+        assert len(stub_nlp.piped) == 1
+
+    def test_same_keys_with_and_without_spacy(self, mock_tool_context, stub_nlp, monkeypatch):
+        """Test that the spaCy and regex fallback paths produce the same article schema."""
+        # Setup
+        mock_tool_context.state['collected_articles'] = [{'title': 'Summit', 'text': _BIDEN_TEXT}]
+        preprocess_articles(mock_tool_context)
+        spacy_article = mock_tool_context.state['preprocessed_articles'][0]
+
+        monkeypatch.setattr(preprocessor_tools, 'SPACY_AVAILABLE', False)
+        monkeypatch.setattr(preprocessor_tools, 'nlp', None)
+        mock_tool_context.state['collected_articles'] = [{'title': 'Summit', 'text': _BIDEN_TEXT}]
+
+        # Execute
+        preprocess_articles(mock_tool_context)
+
+        # Assert
+        fallback_article = mock_tool_context.state['preprocessed_articles'][0]
+        assert spacy_article.keys() == fallback_article.keys()
+        assert spacy_article['entities'] == []
+        assert 'Joe Biden' in fallback_article['entities']
+        assert fallback_article['persons'] == []